@@ -2,22 +2,47 @@
 
 import random
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Optional
 
+import httpx
 from openrouter import OpenRouter
 
+_RETRY_IN_RE = re.compile(r"retry in\s+([0-9.]+)s", re.IGNORECASE)
+_RETRY_DELAY_RE = re.compile(r"retryDelay'?\s*:\s*'?(\d+)(s)?'?", re.IGNORECASE)
+
+_HTTP_CLIENTS_LOCK = threading.Lock()
+_HTTP_CLIENTS: tuple[httpx.Client, httpx.AsyncClient] | None = None
+
+
+def _shared_http_clients() -> tuple[httpx.Client, httpx.AsyncClient]:
+    """Return process-wide HTTP clients so TLS connections are reused across requests.
+
+    The SDK does not close clients it was given, so the pool outlives each
+    ``with OpenRouter(...)`` block. Settings match the SDK's own defaults.
+    """
+    global _HTTP_CLIENTS
+    with _HTTP_CLIENTS_LOCK:
+        if _HTTP_CLIENTS is None:
+            _HTTP_CLIENTS = (
+                httpx.Client(follow_redirects=True),
+                httpx.AsyncClient(follow_redirects=True),
+            )
+        return _HTTP_CLIENTS
+
 
 def _parse_retry_seconds_from_error(err: Exception) -> float:
     """Parse retry delay from error message."""
-    m = re.search(r"retry in\s+([0-9.]+)s", str(err), re.IGNORECASE)
+    text = str(err)
+    m = _RETRY_IN_RE.search(text)
     if m:
         try:
             return float(m.group(1))
         except Exception:
             pass
-    m2 = re.search(r"retryDelay'?\s*:\s*'?(\d+)(s)?'?", str(err), re.IGNORECASE)
+    m2 = _RETRY_DELAY_RE.search(text)
     if m2:
         try:
             return float(m2.group(1))
@@ -59,19 +84,29 @@ def _messages_to_log_text(messages: list[dict]) -> str:
     return "\n".join(parts)
 
 
+def _log_file_stem() -> tuple[int, str]:
+    """Return the Unix timestamp (seconds) and a unique, sortable log file stem.
+
+    Requests run on several worker threads, so whole seconds alone collide;
+    nanoseconds plus the thread id keep concurrent records apart.
+    """
+    ts_ns = time.time_ns()
+    return ts_ns // 1_000_000_000, f"{ts_ns}_{threading.get_ident()}"
+
+
 def _append_openrouter_log(log_dir: Path, model: str, input_text: str, output_text: str) -> None:
     """Write one request/response pair as separate timestamped files under log_dir/logs/.
 
-    Files are named using the Unix timestamp (seconds) of the request:
-    - <ts>_request.txt
-    - <ts>_response.txt
+    Files are named using the request's nanosecond timestamp and thread id:
+    - <ts_ns>_<thread>_request.txt
+    - <ts_ns>_<thread>_response.txt
     """
-    ts_unix = int(time.time())
+    ts_unix, stem = _log_file_stem()
     logs_dir = log_dir / "logs"
     try:
         logs_dir.mkdir(parents=True, exist_ok=True)
-        request_path = logs_dir / f"{ts_unix}_request.txt"
-        response_path = logs_dir / f"{ts_unix}_response.txt"
+        request_path = logs_dir / f"{stem}_request.txt"
+        response_path = logs_dir / f"{stem}_response.txt"
         request_body = (
             f"MODEL: {model}\n"
             f"TIMESTAMP_UNIX: {ts_unix}\n"
@@ -103,11 +138,11 @@ def _append_openrouter_error_log(
 
     This is best-effort and must never raise.
     """
-    ts_unix = int(time.time())
+    ts_unix, stem = _log_file_stem()
     errors_dir = log_dir / "logs" / "errors"
     try:
         errors_dir.mkdir(parents=True, exist_ok=True)
-        error_path = errors_dir / f"{ts_unix}_attempt{attempt}_{error_kind}.txt"
+        error_path = errors_dir / f"{stem}_attempt{attempt}_{error_kind}.txt"
         body = (
             f"MODEL: {model}\n"
             f"TIMESTAMP_UNIX: {ts_unix}\n"
@@ -166,6 +201,7 @@ def request(
     last_err: Exception | None = None
     suggested_delay = 6.0
     input_log_text = _messages_to_log_text(messages) if log_dir else ""
+    http_client, async_http_client = _shared_http_clients()
 
     while attempt < max_attempts:
         try:
@@ -173,6 +209,8 @@ def request(
                 api_key=api_key,
                 http_referer="https://github.com/SilenceRemover",
                 x_title="SilenceRemover",
+                client=http_client,
+                async_client=async_http_client,
             ) as client:
                 request_payload = {
                     "model": model,
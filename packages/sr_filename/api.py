@@ -11,6 +11,10 @@ import sys
 RESERVED_CHARS = ["/", "\\", ":", "*", "?", '"', "<", ">", "|"]
 MAX_FILENAME_LENGTH = 200
 
+# Precomputed str.translate tables (one C-level pass each)
+_CONTROL_CHARS_TABLE = str.maketrans("", "", "\0\n\r\t")
+_RESERVED_CHARS_TABLE = str.maketrans({ch: " " for ch in RESERVED_CHARS})
+
 
 def sanitize_filename(name: str) -> str:
     """Sanitize a string for use as a filesystem filename.
@@ -45,14 +49,13 @@ def sanitize_filename(name: str) -> str:
         'untitled'
     """
     # Step 1: Remove dangerous control characters
-    cleaned = "".join(c for c in name if c not in "\0\n\r\t").strip()
+    cleaned = name.translate(_CONTROL_CHARS_TABLE).strip()
     
     # Step 2: Strip leading/trailing quotes
     cleaned = cleaned.strip('"').strip("'")
     
     # Step 3: Replace reserved filesystem chars with spaces
-    for ch in RESERVED_CHARS:
-        cleaned = cleaned.replace(ch, " ")
+    cleaned = cleaned.translate(_RESERVED_CHARS_TABLE)
     
     # Step 4: Collapse multiple spaces and handle empty result
     cleaned = " ".join(cleaned.split())
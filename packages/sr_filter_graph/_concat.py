@@ -38,11 +38,11 @@ def build_audio_concat_filter_graph(
     Returns:
         FFmpeg filter graph string for audio-only concatenation
     """
-    filter_chains = "".join(
+    filter_chains = "".join([
         f"[0:a]atrim=start={segment_start}:end={segment_end},asetpts=PTS-STARTPTS[a{i}];"
         for i, (segment_start, segment_end) in enumerate(segments_to_keep)
-    )
-    concat_inputs = "".join(f"[a{i}]" for i in range(len(segments_to_keep)))
+    ])
+    concat_inputs = "".join([f"[a{i}]" for i in range(len(segments_to_keep))])
     return build_filter_graph_script(
         len(segments_to_keep),
         filter_chains,
@@ -67,14 +67,14 @@ def build_video_audio_concat_filter_graph(
     Returns:
         FFmpeg filter graph string for video+audio concatenation
     """
-    filter_chains = "".join(
+    filter_chains = "".join([
         (
             f"[0:v]trim=start={segment_start}:end={segment_end},setpts=PTS-STARTPTS[v{i}];"
             f"[0:a]atrim=start={segment_start}:end={segment_end},asetpts=PTS-STARTPTS[a{i}];"
         )
         for i, (segment_start, segment_end) in enumerate(segments_to_keep)
-    )
-    concat_inputs = "".join(f"[v{i}][a{i}]" for i in range(len(segments_to_keep)))
+    ])
+    concat_inputs = "".join([f"[v{i}][a{i}]" for i in range(len(segments_to_keep))])
     return build_filter_graph_script(
         len(segments_to_keep),
         filter_chains,
@@ -99,15 +99,15 @@ def build_video_lavfi_audio_concat_filter_graph(
     Returns:
         FFmpeg filter graph string for video+lavfi audio concatenation
     """
-    filter_chains = "".join(
+    filter_chains = "".join([
         (
             f"[0:v]trim=start={segment_start}:end={segment_end},setpts=PTS-STARTPTS[v{i}];"
             f"[1:a]atrim=start=0:end={_segment_audio_duration_sec(segment_start, segment_end)},"
             f"asetpts=PTS-STARTPTS[a{i}];"
         )
         for i, (segment_start, segment_end) in enumerate(segments_to_keep)
-    )
-    concat_inputs = "".join(f"[v{i}][a{i}]" for i in range(len(segments_to_keep)))
+    ])
+    concat_inputs = "".join([f"[v{i}][a{i}]" for i in range(len(segments_to_keep))])
     return build_filter_graph_script(
         len(segments_to_keep),
         filter_chains,
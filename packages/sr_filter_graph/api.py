@@ -47,14 +47,14 @@ def build_video_audio_concat_filter_graph_with_title_overlay(
         ValueError: If both title and logo are disabled
     """
     segment_count = len(segments_to_keep)
-    filter_chains = "".join(
+    filter_chains = "".join([
         (
             f"[0:v]trim=start={segment_start}:end={segment_end},setpts=PTS-STARTPTS[v{i}];"
             f"[0:a]atrim=start={segment_start}:end={segment_end},asetpts=PTS-STARTPTS[a{i}];"
         )
         for i, (segment_start, segment_end) in enumerate(segments_to_keep)
-    )
-    concat_inputs = "".join(f"[v{i}][a{i}]" for i in range(segment_count))
+    ])
+    concat_inputs = "".join([f"[v{i}][a{i}]" for i in range(segment_count)])
     suffix = _overlay_suffix_after_concat(
         title_overlay_y=overlay_y,
         logo_enabled=logo_enabled,
@@ -158,15 +158,15 @@ def build_video_lavfi_audio_concat_filter_graph_with_title_overlay(
     has_title = overlay_y is not None
     has_logo = logo_enabled
     lavfi_a = _lavfi_input_index(has_title=has_title, has_logo=has_logo)
-    filter_chains = "".join(
+    filter_chains = "".join([
         (
             f"[0:v]trim=start={segment_start}:end={segment_end},setpts=PTS-STARTPTS[v{i}];"
             f"[{lavfi_a}:a]atrim=start=0:end={segment_end - segment_start},"
             f"asetpts=PTS-STARTPTS[a{i}];"
         )
         for i, (segment_start, segment_end) in enumerate(segments_to_keep)
-    )
-    concat_inputs = "".join(f"[v{i}][a{i}]" for i in range(segment_count))
+    ])
+    concat_inputs = "".join([f"[v{i}][a{i}]" for i in range(segment_count)])
     suffix = _overlay_suffix_after_concat(
         title_overlay_y=overlay_y,
         logo_enabled=logo_enabled,
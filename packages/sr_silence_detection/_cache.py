@@ -1,5 +1,9 @@
 from __future__ import annotations
+import copy
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
 
 
@@ -16,26 +20,66 @@ def _get_primary_cache_key(min_duration: float, threshold_db: float) -> str:
     return f"d:{min_duration:.3f}|t:{threshold_db:.3f}"
 
 
-def _load_cache_data(cache_path: Path) -> dict | None:
-    if not cache_path.exists():
+# Parsed cache files keyed by path and revalidated with one stat, so repeated
+# probes in a run (e.g. the target-length threshold search) do not re-read and
+# re-parse the whole JSON on every get/save. Callers get deep copies, since the
+# savers mutate what they load, and parallel Phase 0 workers share the memo.
+_CACHE_MEMO: dict[Path, tuple[tuple[int, int], dict]] = {}
+_CACHE_MEMO_LOCK = threading.Lock()
+
+
+def _cache_file_identity(cache_path: Path) -> tuple[int, int] | None:
+    try:
+        stat = cache_path.stat()
+    except OSError:
         return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_cache_data(cache_path: Path) -> dict | None:
+    identity = _cache_file_identity(cache_path)
+    with _CACHE_MEMO_LOCK:
+        if identity is None:
+            _CACHE_MEMO.pop(cache_path, None)
+            return None
+        memo = _CACHE_MEMO.get(cache_path)
+    if memo is not None and memo[0] == identity:
+        return copy.deepcopy(memo[1])
 
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            cache_data = json.load(f)
-    except (json.JSONDecodeError, OSError):
+        cache_data = json.loads(cache_path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return None
 
     if not isinstance(cache_data, dict):
         return None
 
+    with _CACHE_MEMO_LOCK:
+        _CACHE_MEMO[cache_path] = (identity, copy.deepcopy(cache_data))
     return cache_data
 
 
 def _write_cache_data(cache_path: Path, cache_data: dict) -> None:
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache_data, f, indent=2)
+    # Write beside the target and swap it in, so an interrupted run never
+    # leaves a truncated cache that would discard every earlier probe. The
+    # temp name is unique per writer, so concurrent saves cannot collide.
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(json.dumps(cache_data, separators=(",", ":")))
+            tmp_file.flush()
+            stat = os.fstat(tmp_file.fileno())
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    # The rename keeps the temp file's mtime and size, so this identity
+    # belongs to the data written here even if another writer replaces the
+    # file right after.
+    with _CACHE_MEMO_LOCK:
+        _CACHE_MEMO[cache_path] = ((stat.st_mtime_ns, stat.st_size), copy.deepcopy(cache_data))
 
 
 def _build_file_signature(input_file: Path) -> dict:
@@ -132,8 +176,8 @@ def get_cached_edge_detection(
 
     try:
         return (
-            cache_data["edge_starts"],
-            cache_data["edge_ends"],
+            list(cache_data["edge_starts"]),
+            list(cache_data["edge_ends"]),
             cache_data["duration_sec"],
         )
     except KeyError:
@@ -158,8 +202,8 @@ def save_edge_detection(
         "edge_noise_threshold_db": edge_threshold,
         "edge_min_duration_sec": edge_min_duration,
         "edge_keep_sec": edge_keep_sec,
-        "edge_starts": edge_starts,
-        "edge_ends": edge_ends,
+        "edge_starts": list(edge_starts),
+        "edge_ends": list(edge_ends),
         "duration_sec": duration_sec,
     }
 
@@ -206,8 +250,8 @@ def get_cached_primary_detection(
 
     try:
         return (
-            cache_data["silence_starts"],
-            cache_data["silence_ends"],
+            list(cache_data["silence_starts"]),
+            list(cache_data["silence_ends"]),
             cache_data["duration_sec"],
         )
     except KeyError:
@@ -243,8 +287,8 @@ def save_primary_detection(
         "threshold_db": threshold_db,
         "min_duration_sec": min_duration_sec,
         "duration_sec": duration_sec,
-        "silence_starts": silence_starts,
-        "silence_ends": silence_ends,
+        "silence_starts": list(silence_starts),
+        "silence_ends": list(silence_ends),
     }
 
     _write_cache_data(cache_path, cache_root)
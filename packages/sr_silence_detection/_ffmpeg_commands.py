@@ -4,13 +4,17 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from src.ffmpeg.core import build_ffmpeg_cmd
+from src.ffmpeg.core import build_audio_worker_thread_flags, build_ffmpeg_cmd
 
 
 def _build_silence_detection_command(input_file: Path, noise_threshold: float, min_duration: float) -> list[str]:
-    """Build FFmpeg command for silence detection."""
+    """Build FFmpeg command for silence detection.
+
+    ``-nostats`` keeps periodic progress lines out of the captured stderr; the
+    ``silencedetect`` lines are logged at info level and still come through.
+    """
     silence_filter = f"silencedetect=n={noise_threshold}dB:d={min_duration}"
-    cmd = build_ffmpeg_cmd(overwrite=True)
+    cmd = build_ffmpeg_cmd(True, "-nostats", *build_audio_worker_thread_flags())
     cmd.extend(["-vn", "-sn", "-dn", "-i", str(input_file), "-map", "0:a:0", "-af", silence_filter, "-f", "null", "-"])
     return cmd
 
@@ -26,6 +30,6 @@ def _build_dual_silence_detection_command(
     f_primary = f"silencedetect=n={primary_noise_threshold}dB:d={primary_min_duration}"
     f_edge = f"silencedetect=n={edge_noise_threshold}dB:d={edge_min_duration}"
     chain = f"{f_primary},{f_edge}"
-    cmd = build_ffmpeg_cmd(overwrite=True)
+    cmd = build_ffmpeg_cmd(True, "-nostats", *build_audio_worker_thread_flags())
     cmd.extend(["-vn", "-sn", "-dn", "-i", str(input_file), "-map", "0:a:0", "-af", chain, "-f", "null", "-"])
     return cmd
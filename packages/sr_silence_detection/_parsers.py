@@ -4,11 +4,22 @@ from __future__ import annotations
 
 import re
 
+# One pattern for both event kinds so each log is scanned once; an end value
+# keeps the original non-negative form.
+_SILENCE_EVENT_RE = re.compile(r"silence_(?:start: (-?\d+\.?\d*)|end: (\d+\.?\d*))")
+_FILTER_PTR_RE = re.compile(r"\[silencedetect @ (0x[0-9a-fA-F]+)\]")
+
 
 def _parse_silence_output(result: str) -> tuple[list[float], list[float]]:
     """Parse silencedetect output into silence start/end lists."""
-    silence_starts = [float(x) for x in re.findall(r"silence_start: (-?\d+\.?\d*)", result)]
-    silence_ends = [float(x) for x in re.findall(r"silence_end: (\d+\.?\d*)", result)]
+    silence_starts: list[float] = []
+    silence_ends: list[float] = []
+    for m in _SILENCE_EVENT_RE.finditer(result):
+        start, end = m.groups()
+        if start is not None:
+            silence_starts.append(float(start))
+        else:
+            silence_ends.append(float(end))
     return silence_starts, silence_ends
 
 
@@ -22,35 +33,26 @@ def _parse_dual_silence_output(stderr: str) -> tuple[tuple[list[float], list[flo
     (e.g. one filter emitted no lines), ``ok`` is False and callers should fall back to two
     separate ``_detect_raw`` runs.
     """
-    ptr_order: list[str] = []
-    seen: set[str] = set()
-    for line in stderr.splitlines():
-        m = re.search(r"\[silencedetect @ (0x[0-9a-fA-F]+)\]", line)
-        if m and m.group(1) not in seen:
-            seen.add(m.group(1))
-            ptr_order.append(m.group(1))
-
-    if len(ptr_order) < 2:
-        return ([], []), ([], []), False
-
-    ptr_to_bucket = {p: i for i, p in enumerate(ptr_order[:2])}
-
+    ptr_to_bucket: dict[str, int] = {}
     starts: list[list[float]] = [[], []]
     ends: list[list[float]] = [[], []]
-    start_re = re.compile(r"silence_start: (-?\d+\.?\d*)")
-    end_re = re.compile(r"silence_end: (\d+\.?\d*)")
+    # A pointer's bucket is fixed the first time it appears, so events can be
+    # collected in the same pass that discovers the pointer order.
     for line in stderr.splitlines():
-        m = re.search(r"\[silencedetect @ (0x[0-9a-fA-F]+)\]", line)
+        m = _FILTER_PTR_RE.search(line)
         if not m:
             continue
-        bi = ptr_to_bucket.get(m.group(1))
-        if bi is None:
+        bi = ptr_to_bucket.setdefault(m.group(1), len(ptr_to_bucket))
+        if bi > 1:
             continue
-        sm = start_re.search(line)
-        if sm:
-            starts[bi].append(float(sm.group(1)))
-        em = end_re.search(line)
-        if em:
-            ends[bi].append(float(em.group(1)))
+        for em in _SILENCE_EVENT_RE.finditer(line):
+            start, end = em.groups()
+            if start is not None:
+                starts[bi].append(float(start))
+            else:
+                ends[bi].append(float(end))
+
+    if len(ptr_to_bucket) < 2:
+        return ([], []), ([], []), False
 
     return (starts[0], ends[0]), (starts[1], ends[1]), True
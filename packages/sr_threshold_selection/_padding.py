@@ -21,24 +21,54 @@ def _normalize_timestamp(value: float, *, minimum: float = 0.0) -> float:
     return normalized
 
 
-def _build_keep_segments(
+def _normalize_pair_lists(
     silence_starts: list[float],
     silence_ends: list[float],
     duration_sec: float,
-    pad_sec: float,
-) -> list[tuple[float, float]]:
-    """Build keep-segments from silence intervals with shared padding logic."""
-    pad_sec = _normalize_timestamp(max(0.0, pad_sec))
-    duration_sec = _normalize_timestamp(duration_sec)
-    
-    # Normalize pair lists
+) -> tuple[list[float], list[float]]:
+    """Normalize silence timestamps and pair them; an open silence ends at duration_sec."""
     starts = [_normalize_timestamp(x, minimum=0.0) for x in silence_starts]
     ends = [_normalize_timestamp(x, minimum=0.0) for x in silence_ends]
     if len(starts) > len(ends):
         ends = list(ends) + [duration_sec]
     elif len(starts) < len(ends):
         ends = list(ends[: len(starts)])
-    
+    return starts, ends
+
+
+def _normalize_silence_intervals(
+    silence_starts: list[float],
+    silence_ends: list[float],
+    duration_sec: float,
+) -> tuple[list[float], list[float], float]:
+    """Normalize and pair silence timestamps; independent of padding."""
+    duration_sec = _normalize_timestamp(duration_sec)
+    starts, ends = _normalize_pair_lists(silence_starts, silence_ends, duration_sec)
+    return starts, ends, duration_sec
+
+
+def _intervals_are_ordered(starts: list[float], ends: list[float]) -> bool:
+    """Return True when intervals are sorted and do not overlap.
+
+    Only then does the resulting length grow monotonically with padding.
+    """
+    prev_end = 0.0
+    for silence_start, silence_end in zip(starts, ends):
+        if silence_start < prev_end or silence_end < silence_start:
+            return False
+        prev_end = silence_end
+    return True
+
+
+def _keep_segments_from_normalized(
+    starts: list[float],
+    ends: list[float],
+    duration_sec: float,
+    pad_sec: float,
+) -> list[tuple[float, float]]:
+    """Build keep-segments from already-normalized silence intervals."""
+    pad_sec = _normalize_timestamp(max(0.0, pad_sec))
+
     segments_to_keep: list[tuple[float, float]] = []
     prev_end = 0.0
     
@@ -55,6 +85,47 @@ def _build_keep_segments(
     return segments_to_keep
 
 
+def _build_keep_segments(
+    silence_starts: list[float],
+    silence_ends: list[float],
+    duration_sec: float,
+    pad_sec: float,
+) -> list[tuple[float, float]]:
+    """Build keep-segments from silence intervals with shared padding logic."""
+    starts, ends, duration_sec = _normalize_silence_intervals(silence_starts, silence_ends, duration_sec)
+    return _keep_segments_from_normalized(starts, ends, duration_sec, pad_sec)
+
+
+def _resulting_length_from_normalized(
+    starts: list[float],
+    ends: list[float],
+    duration_sec: float,
+    pad_sec: float,
+) -> float:
+    """Resulting length for one padding value over pre-normalized intervals.
+
+    Mirrors _keep_segments_from_normalized but accumulates the kept length
+    directly, so padding probes do not allocate a segment list per call.
+    """
+    pad_sec = _normalize_timestamp(max(0.0, pad_sec))
+    min_gap = pad_sec * 2 + TRIM_TIMESTAMP_EPSILON_SEC
+
+    total = 0.0
+    prev_end = 0.0
+
+    for silence_start, silence_end in zip(starts, ends):
+        if silence_end - silence_start <= min_gap:
+            continue
+        if silence_start > prev_end + TRIM_TIMESTAMP_EPSILON_SEC:
+            total += _normalize_timestamp(silence_start) - _normalize_timestamp(prev_end)
+        prev_end = _normalize_timestamp(max(0.0, silence_end - pad_sec))
+
+    if prev_end < duration_sec - TRIM_TIMESTAMP_EPSILON_SEC:
+        total += _normalize_timestamp(duration_sec) - _normalize_timestamp(prev_end)
+
+    return _normalize_timestamp(total)
+
+
 def _calculate_resulting_length(
     silence_starts: list[float],
     silence_ends: list[float],
@@ -62,8 +133,8 @@ def _calculate_resulting_length(
     pad_sec: float,
 ) -> float:
     """Calculate the resulting video length after trimming silences with padding."""
-    segments_to_keep = _build_keep_segments(silence_starts, silence_ends, duration_sec, pad_sec)
-    return _normalize_timestamp(sum(end - start for start, end in segments_to_keep))
+    starts, ends, duration_sec = _normalize_silence_intervals(silence_starts, silence_ends, duration_sec)
+    return _resulting_length_from_normalized(starts, ends, duration_sec, pad_sec)
 
 
 def find_optimal_padding(
@@ -74,8 +145,11 @@ def find_optimal_padding(
 ) -> float:
     """Find the optimal padding value to achieve a target video length.
     
-    Iteratively increases padding from 0 to MAX_PAD_SEC in PAD_INCREMENT_SEC
-    steps until the resulting length meets or exceeds the target.
+    Searches padding from 0 to MAX_PAD_SEC on a PAD_INCREMENT_SEC grid for the
+    last step, counting up from 0, whose resulting length stays below the
+    target. For sorted, non-overlapping silences (what silencedetect reports)
+    the resulting length is non-decreasing in padding, so the grid is
+    bisected; any other input falls back to the step-by-step scan.
     
     Args:
         silence_starts: List of silence start times in seconds
@@ -91,7 +165,12 @@ def find_optimal_padding(
     if not silence_starts:
         return 0.0
     
-    result_with_0 = _calculate_resulting_length(silence_starts, silence_ends, duration_sec, 0.0)
+    # Normalization does not depend on padding, so do it once for every probe.
+    starts, ends, normalized_duration = _normalize_silence_intervals(
+        silence_starts, silence_ends, duration_sec
+    )
+
+    result_with_0 = _resulting_length_from_normalized(starts, ends, normalized_duration, 0.0)
     if result_with_0 + TRIM_TIMESTAMP_EPSILON_SEC > target_length:
         return 0.0
     
@@ -101,14 +180,34 @@ def find_optimal_padding(
         return 0.0
     
     max_steps = int(max_pad / pad_increment + TRIM_TIMESTAMP_EPSILON_SEC)
-    best_pad = 0.0
-    
-    for step in range(max_steps + 1):
-        current_pad = _normalize_timestamp(min(max_pad, step * pad_increment))
-        resulting_length = _calculate_resulting_length(silence_starts, silence_ends, duration_sec, current_pad)
-        if resulting_length < target_length - TRIM_TIMESTAMP_EPSILON_SEC:
-            best_pad = current_pad
-            continue
-        break
-    
-    return best_pad
+
+    def _pad_for_step(step: int) -> float:
+        return _normalize_timestamp(min(max_pad, step * pad_increment))
+
+    def _reaches_target(step: int) -> bool:
+        resulting_length = _resulting_length_from_normalized(
+            starts, ends, normalized_duration, _pad_for_step(step)
+        )
+        return resulting_length >= target_length - TRIM_TIMESTAMP_EPSILON_SEC
+
+    if not _intervals_are_ordered(starts, ends):
+        best_pad = 0.0
+        for step in range(max_steps + 1):
+            if _reaches_target(step):
+                break
+            best_pad = _pad_for_step(step)
+        return best_pad
+
+    # Resulting length never decreases as padding grows, so bisect for the
+    # first step that reaches the target instead of probing every step.
+    lo, hi = 0, max_steps + 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _reaches_target(mid):
+            hi = mid
+        else:
+            lo = mid + 1
+
+    if lo == 0:
+        return 0.0
+    return _pad_for_step(lo - 1)
@@ -6,7 +6,7 @@ Pure algorithm: no FFmpeg dependencies, operates on pre-computed detection resul
 from dataclasses import dataclass
 from typing import Optional
 
-from sr_threshold_selection._padding import find_optimal_padding
+from sr_threshold_selection._padding import _calculate_resulting_length, find_optimal_padding
 from src.core.constants import TRIM_TIMESTAMP_EPSILON_SEC
 
 
@@ -109,11 +109,9 @@ def build_candidates_from_detection_results(
     Returns:
         List of ThresholdCandidate objects with base_trimmed_length computed
     """
-    from src.media.silence_detector import calculate_resulting_length
-    
     candidates = []
     for threshold_db, starts, ends, duration_sec in results:
-        base_length = calculate_resulting_length(starts, ends, duration_sec, 0.0)
+        base_length = _calculate_resulting_length(starts, ends, duration_sec, 0.0)
         candidates.append(ThresholdCandidate(
             threshold_db=threshold_db,
             silence_starts=starts,
@@ -263,6 +263,10 @@ def generate_title_with_openrouter(
     if not candidates:
         raise RuntimeError("Title generation returned empty response")
 
+    # A lone candidate wins any scoring, so skip the second round-trip.
+    if len(candidates) == 1:
+        return candidates[0]
+
     # Phase 2: one scoring call (verbatim + correctness per candidate), then argmax + tie-break.
     score_rows = _evaluate_title_candidates(
         api_key,
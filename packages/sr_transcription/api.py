@@ -29,18 +29,19 @@ def transcribe_with_openrouter(
     Returns:
         Transcript text
     """
-    audio_bytes = audio_path.read_bytes()
-    if not audio_bytes:
-        raise RuntimeError(
-            f"Audio file is empty: {audio_path.name}. Recreate the snippet before transcription."
-        )
-    audio_b64 = base64.b64encode(audio_bytes).decode("utf-8")
-
     audio_format = audio_path.suffix.lstrip(".").lower()
     if audio_format not in AUDIO_FORMATS:
         supported = ", ".join(sorted(AUDIO_FORMATS))
         raise ValueError(f"Unsupported audio format: {audio_format}. Supported: {supported}")
 
+    if audio_path.stat().st_size == 0:
+        raise RuntimeError(
+            f"Audio file is empty: {audio_path.name}. Recreate the snippet before transcription."
+        )
+    # Encode straight from the read so the raw bytes are released right away;
+    # base64 output is pure ASCII.
+    audio_b64 = base64.b64encode(audio_path.read_bytes()).decode("ascii")
+
     messages = [
         {
             "role": "user",
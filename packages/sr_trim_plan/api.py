@@ -150,8 +150,12 @@ def binary_search_padding(
     base_padding_sec: float = TARGET_SEARCH_BASE_PADDING_SEC,
     padding_step_sec: float = TARGET_SEARCH_PADDING_STEP_SEC,
     epsilon_sec: float = TRIM_TIMESTAMP_EPSILON_SEC,
-) -> float:
-    """Return the largest padding on the discrete grid that stays at or under target."""
+) -> tuple[float, float | None]:
+    """Return the largest grid padding at or under target and its estimated length.
+
+    The length is the estimator's value for the returned padding, so callers do
+    not have to re-estimate it; it is ``None`` when the base padding is invalid.
+    """
     base_padding_sec = round(base_padding_sec, 3)
     max_offset_idx = max(
         0,
@@ -160,9 +164,10 @@ def binary_search_padding(
 
     base_length = estimate_length(base_padding_sec)
     if base_length is None or base_length > target_length + epsilon_sec:
-        return base_padding_sec
+        return base_padding_sec, base_length
 
     valid_offset_idx = 0
+    valid_length = base_length
     current_offset_idx = 1
     upper_bound_offset_idx: int | None = None
 
@@ -179,19 +184,26 @@ def binary_search_padding(
             break
 
         valid_offset_idx = current_offset_idx
+        valid_length = estimated_length
         if current_offset_idx == max_offset_idx:
-            return _padding_from_offset(
-                base_padding_sec,
-                valid_offset_idx,
-                padding_step_sec=padding_step_sec,
+            return (
+                _padding_from_offset(
+                    base_padding_sec,
+                    valid_offset_idx,
+                    padding_step_sec=padding_step_sec,
+                ),
+                valid_length,
             )
         current_offset_idx = min(max_offset_idx, current_offset_idx * 2)
 
     if upper_bound_offset_idx is None or valid_offset_idx >= upper_bound_offset_idx:
-        return _padding_from_offset(
-            base_padding_sec,
-            valid_offset_idx,
-            padding_step_sec=padding_step_sec,
+        return (
+            _padding_from_offset(
+                base_padding_sec,
+                valid_offset_idx,
+                padding_step_sec=padding_step_sec,
+            ),
+            valid_length,
         )
 
     low_offset_idx = valid_offset_idx
@@ -208,14 +220,18 @@ def binary_search_padding(
 
         if estimated_length is not None and estimated_length <= target_length + epsilon_sec:
             valid_offset_idx = mid_offset_idx
+            valid_length = estimated_length
             low_offset_idx = mid_offset_idx
         else:
             high_offset_idx = mid_offset_idx - 1
 
-    return _padding_from_offset(
-        base_padding_sec,
-        valid_offset_idx,
-        padding_step_sec=padding_step_sec,
+    return (
+        _padding_from_offset(
+            base_padding_sec,
+            valid_offset_idx,
+            padding_step_sec=padding_step_sec,
+        ),
+        valid_length,
     )
 
 
@@ -361,8 +377,9 @@ def _build_target_trim_plan(
         chosen_probe = _full_duration_probe_result(duration_sec)
 
     chosen_pad_sec = TARGET_SEARCH_BASE_PADDING_SEC
+    chosen_length_sec: float | None = None
     if reached_target:
-        chosen_pad_sec = binary_search_padding(
+        chosen_pad_sec, chosen_length_sec = binary_search_padding(
             target_length=target_length,
             duration_sec=duration_sec,
             estimate_length=lambda pad_sec: calculate_resulting_length(
@@ -379,13 +396,14 @@ def _build_target_trim_plan(
         duration_sec=duration_sec,
         pad_sec=chosen_pad_sec,
     )
-    resulting_length = normalize_timestamp(sum(end - start for start, end in segments_to_keep))
+    if chosen_length_sec is None:
+        chosen_length_sec = normalize_timestamp(sum(end - start for start, end in segments_to_keep))
 
     return TrimPlan(
         mode="target",
         segments_to_keep=segments_to_keep,
         input_duration_sec=duration_sec,
-        resulting_length_sec=resulting_length,
+        resulting_length_sec=chosen_length_sec,
         resolved_noise_threshold=chosen_threshold_db,
         resolved_min_duration=TARGET_SEARCH_MIN_SILENCE_LEN_SEC,
         resolved_pad_sec=chosen_pad_sec,
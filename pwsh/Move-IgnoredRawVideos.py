@@ -11,23 +11,13 @@ from ctypes import wintypes
 from dataclasses import dataclass
 from pathlib import Path
 
+# Share the pipeline's video-extension filter so both scans pick the same files.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+for _import_root in (PROJECT_ROOT, PROJECT_ROOT / "packages"):
+    if str(_import_root) not in sys.path:
+        sys.path.insert(0, str(_import_root))
 
-VIDEO_EXTENSIONS = {
-    ".mp4",
-    ".mkv",
-    ".avi",
-    ".mov",
-    ".flv",
-    ".wmv",
-    ".webm",
-    ".m4v",
-    ".mpg",
-    ".mpeg",
-    ".3gp",
-    ".ogv",
-    ".ts",
-    ".m2ts",
-}
+from src.core.cli import _has_video_extension
 
 SILENCE_START_RE = re.compile(r"silence_start:\s*(?P<value>-?\d+(?:\.\d+)?)")
 SILENCE_END_RE = re.compile(r"silence_end:\s*(?P<value>-?\d+(?:\.\d+)?)")
@@ -294,14 +284,18 @@ def is_fully_silent_video(
 
 
 def get_unique_ignored_destination(file_path: Path, ignored_dir: Path) -> Path:
-    destination = ignored_dir / file_path.name
-    if not destination.exists():
-        return destination
+    try:
+        existing = {os.path.normcase(name) for name in os.listdir(ignored_dir)}
+    except FileNotFoundError:
+        existing = set()
+
+    if os.path.normcase(file_path.name) not in existing:
+        return ignored_dir / file_path.name
 
     for index in range(1, 1000):
-        candidate = ignored_dir / f"{file_path.stem}__ignored_{index}{file_path.suffix}"
-        if not candidate.exists():
-            return candidate
+        candidate_name = f"{file_path.stem}__ignored_{index}{file_path.suffix}"
+        if os.path.normcase(candidate_name) not in existing:
+            return ignored_dir / candidate_name
 
     raise RuntimeError(f"Could not find a unique ignored destination for '{file_path}'.")
 
@@ -329,14 +323,15 @@ def get_completed_marker_path(raw_path: Path, file_path: Path) -> Path:
 
 
 def iter_video_files(raw_path: Path) -> list[Path]:
-    return sorted(
-        (
-            path
-            for path in raw_path.iterdir()
-            if path.is_file() and path.suffix.lower() in VIDEO_EXTENSIONS
-        ),
-        key=lambda path: path.name,
-    )
+    with os.scandir(raw_path) as entries:
+        return sorted(
+            (
+                Path(entry.path)
+                for entry in entries
+                if _has_video_extension(entry.name) and entry.is_file()
+            ),
+            key=lambda path: path.name,
+        )
 
 
 def invoke_raw_preflight_scan(
@@ -3,18 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import os
 import shutil
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional, TextIO
+from typing import Callable, Iterator, Optional, TextIO
 
 
 from src.core.cli import parse_args
 from src.core.constants import (
     AUDIO_EXTENSIONS,
     DEFAULT_LOGO_PATH,
+    OPENROUTER_MAX_CONCURRENCY,
     SNIPPET_MAX_DURATION_SEC,
     TITLE_DIR,
 )
@@ -24,6 +29,7 @@ from src.core.paths import (
     get_snippet_path,
     get_title_path,
     get_title_overlay_path,
+    get_transcript_cache_path,
     get_transcript_path,
     is_completed,
     is_snippet_done,
@@ -42,7 +48,7 @@ from sr_telegram_notify import (
     notify_video_uploaded,
 )
 from sr_title import generate_title_from_transcript
-from sr_transcription import transcribe_and_save
+from sr_transcription import DEFAULT_MODEL, TRANSCRIBE_PROMPT, transcribe_and_save
 from src.ffmpeg.trim_script_bundle import (
     generate_trim_script,
     get_snippet_trim_script_path,
@@ -68,16 +74,22 @@ class _PipelinePhase:
     run: Callable[[Path, int, int], bool | None]
     skip_reason: Callable[[Path], str | None] | None = None
     checked_paths: Callable[[Path], list[str]] | None = None
+    max_workers: int = 1
 
 
 class _ConsolePhaseProgress:
-    """Plain line-by-line phase progress output."""
+    """Plain line-by-line phase progress output.
+
+    Parallel phases report from worker threads, so every write goes through
+    one re-entrant lock to keep whole lines and the live TTY line intact.
+    """
 
     def __init__(self, stream: TextIO) -> None:
         self.stream = stream
         self._is_tty = bool(getattr(stream, "isatty", lambda: False)())
         self._current_phase: str | None = None
         self._live_line_open = False
+        self._lock = threading.RLock()
 
     @staticmethod
     def _ellipsize(text: str, max_len: int) -> str:
@@ -102,19 +114,29 @@ class _ConsolePhaseProgress:
         return self._ellipsize(message, terminal_width)
 
     def start_phase(self, label: str) -> None:
-        if self._current_phase == label:
-            return
-        self.finish_line()
-        self.stream.write("\n")
-        self.stream.flush()
-        self._current_phase = label
+        with self._lock:
+            if self._current_phase == label:
+                return
+            self.finish_line()
+            self.stream.write("\n")
+            self.stream.flush()
+            self._current_phase = label
 
     def show_file_progress(self, label: str, video_index: int, total_videos: int, name: str) -> None:
-        self.start_phase(label)
-        self.finish_line()
-        message = f"[{label}] File {video_index}/{total_videos}: {name}"
-        self.stream.write(f"{message}\n")
-        self.stream.flush()
+        with self._lock:
+            self.start_phase(label)
+            self.finish_line()
+            message = f"[{label}] File {video_index}/{total_videos}: {name}"
+            self.stream.write(f"{message}\n")
+            self.stream.flush()
+
+    def show_processing(self, label: str, video_index: int, total_videos: int, name: str) -> None:
+        """Announce one video's step as a single block, even under concurrency."""
+        with self._lock:
+            self.finish_line()
+            self.stream.write(f"  processing: {name}\n")
+            self.stream.flush()
+            self.show_file_progress(label, video_index, total_videos, name)
 
     def show_skip(
         self,
@@ -126,19 +148,20 @@ class _ConsolePhaseProgress:
         skip_count: int,
     ) -> None:
         message = f"  skip: {name} ({reason})"
-        if self._is_tty:
-            clear_suffix = "\033[K"
-            message = self._format_tty_skip_message(
-                label=label,
-                video_index=video_index,
-                total_videos=total_videos,
-                name=name,
-            )
-            self.stream.write(f"\r{message}{clear_suffix}")
-            self._live_line_open = True
-        else:
-            self.stream.write(f"{message}\n")
-        self.stream.flush()
+        with self._lock:
+            if self._is_tty:
+                clear_suffix = "\033[K"
+                message = self._format_tty_skip_message(
+                    label=label,
+                    video_index=video_index,
+                    total_videos=total_videos,
+                    name=name,
+                )
+                self.stream.write(f"\r{message}{clear_suffix}")
+                self._live_line_open = True
+            else:
+                self.stream.write(f"{message}\n")
+            self.stream.flush()
 
     def show_upload_progress(
         self,
@@ -152,7 +175,6 @@ class _ConsolePhaseProgress:
         if not self._is_tty or total_bytes <= 0:
             return
 
-        self.start_phase(label)
         transferred = min(max(uploaded_bytes, 0), total_bytes)
         percent = int(min(100.0, max(0.0, (transferred / total_bytes) * 100.0)))
         transferred_mib = transferred / (1024 * 1024)
@@ -161,30 +183,35 @@ class _ConsolePhaseProgress:
             f"[{label}] Upload {video_index}/{total_videos}: {name} | "
             f"{percent}% | {transferred_mib:.2f}/{total_mib:.2f} MiB"
         )
-        self.stream.write(f"\r{message}\033[K")
-        self.stream.flush()
-        self._live_line_open = True
+        with self._lock:
+            self.start_phase(label)
+            self.stream.write(f"\r{message}\033[K")
+            self.stream.flush()
+            self._live_line_open = True
 
     def show_failure(self, name: str, reason: str) -> None:
-        self.finish_line()
-        self.stream.write(f"  failed: {name} ({reason})\n")
-        self.stream.flush()
+        with self._lock:
+            self.finish_line()
+            self.stream.write(f"  failed: {name} ({reason})\n")
+            self.stream.flush()
 
     def show_check(self, name: str, paths: list[str]) -> None:
-        self.finish_line()
         if paths:
             checked = " | ".join(paths)
         else:
             checked = "(no path)"
-        self.stream.write(f"  check: {name} -> {checked}\n")
-        self.stream.flush()
+        with self._lock:
+            self.finish_line()
+            self.stream.write(f"  check: {name} -> {checked}\n")
+            self.stream.flush()
 
     def finish_line(self) -> None:
-        if not self._live_line_open:
-            return
-        self.stream.write("\n")
-        self.stream.flush()
-        self._live_line_open = False
+        with self._lock:
+            if not self._live_line_open:
+                return
+            self.stream.write("\n")
+            self.stream.flush()
+            self._live_line_open = False
 
 
 _PHASE_PROGRESS: _ConsolePhaseProgress | None = None
@@ -198,53 +225,95 @@ def _get_phase_progress() -> _ConsolePhaseProgress:
     return _PHASE_PROGRESS
 
 
-def _run_phase(
-    videos: list[Path], phase: _PipelinePhase
-) -> tuple[int, int, int]:
-    """Run one phase over all videos.
-    
-    Returns: (success_count, skip_count, fail_count)
-    """
-    n = len(videos)
-    success_count = 0
-    skip_count = 0
-    fail_count = 0
-    phase_progress = _get_phase_progress()
-    phase_progress.start_phase(phase.label)
+@dataclass
+class _PhaseTally:
+    success: int = 0
+    skip: int = 0
+    fail: int = 0
 
+    def record(self, result: bool | None) -> None:
+        if result is True:
+            self.success += 1
+        elif result is None:
+            self.skip += 1
+        else:
+            self.fail += 1
+
+
+def _iter_runnable_videos(
+    videos: list[Path],
+    phase: _PipelinePhase,
+    phase_progress: _ConsolePhaseProgress,
+    tally: _PhaseTally,
+) -> Iterator[tuple[int, Path]]:
+    """Report skips and checks in input order; yield the videos left to run."""
+    n = len(videos)
     for i, video_file in enumerate(videos, 1):
         if phase.skip_reason is not None:
             reason = phase.skip_reason(video_file)
             if reason:
-                skip_count += 1
+                tally.skip += 1
                 phase_progress.show_skip(
                     phase.label,
                     i,
                     n,
                     video_file.name,
                     reason,
-                    skip_count,
+                    tally.skip,
                 )
                 continue
         if phase.checked_paths is not None:
             phase_progress.show_check(video_file.name, phase.checked_paths(video_file))
-        try:
-            result = phase.run(video_file, i, n)
-        except Exception as err:
-            fail_count += 1
-            reason = str(err).strip() or err.__class__.__name__
-            phase_progress.show_failure(video_file.name, reason)
-            continue
-        if result is True:
-            success_count += 1
-        elif result is None:
-            skip_count += 1
-        else:
-            fail_count += 1
+        yield i, video_file
+
+
+def _run_phase(
+    videos: list[Path], phase: _PipelinePhase
+) -> tuple[int, int, int]:
+    """Run one phase over all videos.
+
+    With ``phase.max_workers > 1`` the skip checks still run serially, so skip
+    output keeps its order, and the remaining videos go to a bounded thread
+    pool. Phase work is dominated by FFmpeg subprocesses and HTTP calls, which
+    release the GIL while waiting. Results are tallied on the calling thread.
+    
+    Returns: (success_count, skip_count, fail_count)
+    """
+    n = len(videos)
+    tally = _PhaseTally()
+    phase_progress = _get_phase_progress()
+    phase_progress.start_phase(phase.label)
+    runnable = _iter_runnable_videos(videos, phase, phase_progress, tally)
+
+    def _record_failure(video_file: Path, err: Exception) -> None:
+        tally.fail += 1
+        reason = str(err).strip() or err.__class__.__name__
+        phase_progress.show_failure(video_file.name, reason)
+
+    if phase.max_workers > 1:
+        pending = list(runnable)
+        workers = min(phase.max_workers, len(pending))
+        if workers:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(phase.run, video_file, i, n): video_file
+                    for i, video_file in pending
+                }
+                for future in as_completed(futures):
+                    try:
+                        tally.record(future.result())
+                    except Exception as err:
+                        _record_failure(futures[future], err)
+    else:
+        for i, video_file in runnable:
+            try:
+                tally.record(phase.run(video_file, i, n))
+            except Exception as err:
+                _record_failure(video_file, err)
 
     phase_progress.finish_line()
     
-    return success_count, skip_count, fail_count
+    return tally.success, tally.skip, tally.fail
 
 
 def _run_phase_step(
@@ -256,17 +325,12 @@ def _run_phase_step(
 ) -> bool | None:
     """Execute a single phase step."""
     phase_progress = _get_phase_progress()
-    phase_progress.finish_line()
-    stream = phase_progress.stream
-    stream.write(f"  processing: {video_path.name}\n")
-    stream.flush()
-    phase_progress.show_file_progress(label, video_index, total_videos, video_path.name)
+    phase_progress.show_processing(label, video_index, total_videos, video_path.name)
 
     try:
         work_fn()
         return True
     except Exception as err:
-        phase_progress.finish_line()
         reason = str(err).strip() or err.__class__.__name__
         phase_progress.show_failure(video_path.name, reason)
         return False
@@ -294,11 +358,19 @@ def _build_upload_progress_callback(
     return _on_progress
 
 
-def transcribe_media(audio_path: Path, temp_dir: Path, api_key: str, basename: str) -> None:
+def transcribe_media(
+    audio_path: Path,
+    temp_dir: Path,
+    api_key: str,
+    basename: str,
+    use_cache: bool = True,
+) -> None:
     """Transcribe from an audio file and save transcript to file.
 
     ``audio_path`` must be a supported audio extension (see ``AUDIO_EXTENSIONS``);
     video inputs are not accepted here—produce a snippet or extract audio first.
+    With ``use_cache=False`` the API is always called; the fresh transcript
+    still replaces the cached one for later runs.
     """
     ext = audio_path.suffix.lower()
     if ext not in AUDIO_EXTENSIONS:
@@ -310,13 +382,43 @@ def transcribe_media(audio_path: Path, temp_dir: Path, api_key: str, basename: s
     resolved = audio_path.resolve()
     transcript_path = get_transcript_path(temp_dir, basename)
 
+    # Identical snippets (e.g. after renaming a raw video) reuse the earlier
+    # transcript instead of paying for another API call. The key also covers
+    # the model and prompt, so changing either transcribes again.
+    with open(resolved, "rb") as audio_file:
+        cache_key = hashlib.file_digest(audio_file, "sha256")
+    cache_key.update(f"\0{DEFAULT_MODEL}\0{TRANSCRIBE_PROMPT}".encode("utf-8"))
+    cache_path = get_transcript_cache_path(temp_dir, cache_key.hexdigest())
+    if use_cache:
+        try:
+            cached_text = cache_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            cached_text = ""
+        if cached_text.strip():
+            transcript_path.parent.mkdir(parents=True, exist_ok=True)
+            transcript_path.write_text(cached_text, encoding="utf-8")
+            return
+
     transcribe_and_save(
         api_key=api_key,
         audio_path=resolved,
         output_path=transcript_path,
+        model=DEFAULT_MODEL,
         log_dir=temp_dir,
     )
 
+    # Parallel Phase 2 workers may store the same key; a unique temp file plus
+    # os.replace means readers only ever see a complete transcript.
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=f"{cache_path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file, open(transcript_path, "rb") as transcript_file:
+            shutil.copyfileobj(transcript_file, tmp_file)
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
 
 def generate_title(
     temp_dir: Path, api_key: str, basename: str
@@ -371,13 +473,20 @@ def run_transcription_phase(
     api_key: str,
     video_index: int,
     total_videos: int,
+    use_transcript_cache: bool = True,
 ) -> bool | None:
     """Phase 2: Transcribe existing snippet to `temp/transcript/{basename}.txt`."""
     basename = video_path.stem
     snippet_path = get_snippet_path(temp_dir, basename)
 
     def _perform() -> None:
-        transcribe_media(audio_path=snippet_path, temp_dir=temp_dir, api_key=api_key, basename=basename)
+        transcribe_media(
+            audio_path=snippet_path,
+            temp_dir=temp_dir,
+            api_key=api_key,
+            basename=basename,
+            use_cache=use_transcript_cache,
+        )
 
     return _run_phase_step(
         video_path=video_path,
@@ -860,6 +969,13 @@ def run(args: argparse.Namespace | None = None) -> StartupContext:
     if not videos:
         return startup
 
+    # Phases 0-1 are independent per video (silencedetect + snippet encode), so
+    # they may run on a bounded worker pool; Phases 2-3 use the smaller LLM pool
+    # below, and Phases 4-10 stay serial.
+    phase_workers = getattr(args, "jobs", None) or os.cpu_count() or 1
+    # Phases 2-3 wait on OpenRouter round-trips; overlap a few of them.
+    llm_workers = min(phase_workers, OPENROUTER_MAX_CONCURRENCY)
+
     def _title_text(video_file: Path) -> str:
         title_path = get_title_path(temp_dir, video_file.stem)
         if not title_path.exists():
@@ -934,6 +1050,7 @@ def run(args: argparse.Namespace | None = None) -> StartupContext:
                 str(_trim_script_path(video_file)),
                 str(_snippet_trim_script_path(video_file)),
             ],
+            max_workers=phase_workers,
         ),
         # NEW: Phase 1 - Snippet Creation
         _PipelinePhase(
@@ -965,6 +1082,7 @@ def run(args: argparse.Namespace | None = None) -> StartupContext:
                 str(_trim_script_path(video_file)),
                 str(_snippet_trim_script_path(video_file)),
             ],
+            max_workers=phase_workers,
         ),
         # UPDATED: Phase 2 - Transcription (was Phase 1)
         _PipelinePhase(
@@ -977,20 +1095,29 @@ def run(args: argparse.Namespace | None = None) -> StartupContext:
                 api_key=api_key,
                 video_index=vi,
                 total_videos=vn,
+                use_transcript_cache=not getattr(args, "no_transcript_cache", False),
             ),
             skip_reason=lambda video_file: (
                 "transcript already exists"
                 if is_transcript_done(temp_dir, video_file.stem)
                 else (
-                    "snippet missing or empty (run phase 1 first)"
-                    if not is_snippet_done(temp_dir, video_file.stem)
-                    else None
+                    # The transcript only feeds title generation; a title
+                    # already synced or written by hand makes the call moot.
+                    "title already exists"
+                    if is_title_done(temp_dir, video_file.stem)
+                    else (
+                        "snippet missing or empty (run phase 1 first)"
+                        if not is_snippet_done(temp_dir, video_file.stem)
+                        else None
+                    )
                 )
             ),
             checked_paths=lambda video_file: [
                 str(get_snippet_path(temp_dir, video_file.stem)),
                 str(get_transcript_path(temp_dir, video_file.stem)),
+                str(get_title_path(temp_dir, video_file.stem)),
             ],
+            max_workers=llm_workers,
         ),
         # UPDATED: Phase 3 - Title Generation (was Phase 2)
         _PipelinePhase(
@@ -1006,11 +1133,17 @@ def run(args: argparse.Namespace | None = None) -> StartupContext:
             skip_reason=lambda video_file: (
                 "title already exists"
                 if is_title_done(temp_dir, video_file.stem)
-                else None
+                else (
+                    "transcript missing (run phase 2 first)"
+                    if not is_transcript_done(temp_dir, video_file.stem)
+                    else None
+                )
             ),
             checked_paths=lambda video_file: [
                 str(get_title_path(temp_dir, video_file.stem)),
+                str(get_transcript_path(temp_dir, video_file.stem)),
             ],
+            max_workers=llm_workers,
         ),
         # UPDATED: Phase 4 - Audio Upload (was Phase 3)
         _PipelinePhase(
@@ -1143,33 +1276,28 @@ def run(args: argparse.Namespace | None = None) -> StartupContext:
             skip_reason=lambda video_file: ("already completed"
                 if is_completed(temp_dir, video_file.stem)
                 else (
-                    "transcript missing (run phase 2 first)"
-                    if not is_transcript_done(temp_dir, video_file.stem)
+                    "title missing (run phase 3 first)"
+                    if not is_title_done(temp_dir, video_file.stem)
                     else (
-                        "title missing (run phase 3 first)"
-                        if not is_title_done(temp_dir, video_file.stem)
+                        "title empty"
+                        if not _title_text(video_file)
                         else (
-                            "title empty"
-                            if not _title_text(video_file)
-                            else (
-                                "trim script missing (run phase 0 first)"
-                                if not is_trim_script_ready(
-                                    input_file=video_file,
-                                    temp_dir=temp_dir,
-                                    target_length=startup.target_length,
-                                    noise_threshold=startup.noise_threshold,
-                                    min_duration=startup.min_duration,
-                                    pad_sec=startup.pad_sec,
-                                )
-                                else None
+                            "trim script missing (run phase 0 first)"
+                            if not is_trim_script_ready(
+                                input_file=video_file,
+                                temp_dir=temp_dir,
+                                target_length=startup.target_length,
+                                noise_threshold=startup.noise_threshold,
+                                min_duration=startup.min_duration,
+                                pad_sec=startup.pad_sec,
                             )
+                            else None
                         )
                     )
                 )
             ),
             checked_paths=lambda video_file: [
                 str(get_completed_path(temp_dir, video_file.stem)),
-                str(get_transcript_path(temp_dir, video_file.stem)),
                 str(get_title_path(temp_dir, video_file.stem)),
                 str(_trim_script_path(video_file)),
                 str(_snippet_trim_script_path(video_file)),
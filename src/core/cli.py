@@ -1,8 +1,10 @@
 """CLI argument parsing and validation utilities."""
 
 import argparse
+import os
 import shutil
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from src.core.fs_utils import is_file_locked
@@ -35,9 +37,15 @@ def fail(message: str) -> None:
     sys.exit(1)
 
 
+@lru_cache(maxsize=None)
+def _which(tool: str) -> str | None:
+    """Memoized ``shutil.which``; PATH does not change during a run."""
+    return shutil.which(tool)
+
+
 def require_tools(*tools: str) -> None:
     """Check that required tools are available on PATH."""
-    missing = [t for t in tools if shutil.which(t) is None]
+    missing = [t for t in tools if _which(t) is None]
     if missing:
         fail(f"Required tool(s) not found on PATH: {', '.join(missing)}")
 
@@ -48,6 +56,22 @@ def require_input_dir(input_dir: Path) -> None:
         fail(f"Input directory does not exist: {input_dir}")
 
 
+@lru_cache(maxsize=64)
+def _is_video_suffix(suffix: str) -> bool:
+    """Case-insensitive ``VIDEO_EXTENSIONS`` check, memoized per raw suffix."""
+    return suffix.lower() in VIDEO_EXTENSIONS
+
+
+def _has_video_extension(name: str) -> bool:
+    """Return True when a bare filename ends in a supported video extension.
+
+    Works on ``DirEntry.name`` directly; like ``Path.suffix``, a leading dot
+    alone (e.g. ``.mp4``) is not treated as an extension.
+    """
+    dot = name.rfind(".")
+    return dot > 0 and _is_video_suffix(name[dot:])
+
+
 def collect_video_files(input_dir: Path) -> list[Path]:
     """Collect supported video files from a directory.
 
@@ -56,9 +80,15 @@ def collect_video_files(input_dir: Path) -> list[Path]:
     """
     video_files = []
     locked_video_files = []
-    for p in input_dir.iterdir():
-        if not p.is_file() or p.suffix.lower() not in VIDEO_EXTENSIONS:
-            continue
+    # scandir exposes the file type from the directory listing, so the
+    # is_file() check does not cost an extra stat per entry.
+    with os.scandir(input_dir) as entries:
+        candidates = [
+            Path(entry.path)
+            for entry in entries
+            if _has_video_extension(entry.name) and entry.is_file()
+        ]
+    for p in candidates:
         if is_file_locked(p):
             locked_video_files.append(p)
             continue
@@ -76,7 +106,14 @@ def collect_video_files(input_dir: Path) -> list[Path]:
 def require_videos_in(input_dir: Path) -> None:
     """Check that input directory contains video files."""
     try:
-        has_video = len(collect_video_files(input_dir)) > 0
+        # Stop at the first usable video instead of listing and lock-probing all.
+        with os.scandir(input_dir) as entries:
+            has_video = any(
+                _has_video_extension(entry.name)
+                and entry.is_file()
+                and not is_file_locked(Path(entry.path))
+                for entry in entries
+            )
     except FileNotFoundError:
         has_video = False
     if not has_video:
@@ -94,6 +131,17 @@ def _positive_float(value: str) -> float:
     return parsed
 
 
+def _positive_int(value: str) -> int:
+    try:
+        parsed = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Must be an integer, got '{value}'")
+
+    if parsed <= 0:
+        raise argparse.ArgumentTypeError(f"Value must be greater than 0, got '{value}'")
+    return parsed
+
+
 def parse_args() -> argparse.Namespace:
     """Parse CLI arguments and return namespace."""
     parser = argparse.ArgumentParser(
@@ -152,6 +200,24 @@ def parse_args() -> argparse.Namespace:
         default="X265",
         help="Video encoder: QSV (Intel QuickSync), AMF (AMD), or X265 (software)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=None,
+        help=(
+            "Number of videos processed concurrently in Phases 0-1 (trim script and snippet); "
+            "Phases 2-3 (transcription and title) are further capped at OPENROUTER_MAX_CONCURRENCY. "
+            "Defaults to the CPU count; use 1 for fully serial runs."
+        ),
+    )
+    parser.add_argument(
+        "--no-transcript-cache",
+        action="store_true",
+        help=(
+            "Always call the transcription API in Phase 2 instead of reusing the transcript of "
+            "byte-identical audio from output/temp/transcript_cache/; the fresh result replaces the cached one."
+        ),
+    )
     parser.add_argument(
         "--enable-title-overlay",
         action="store_true",
@@ -94,6 +94,8 @@ SNIPPET_MAX_DURATION_SEC = 60.0
 
 # --- OpenRouter LLM defaults (transcription + title packages) ---
 OPENROUTER_DEFAULT_MODEL = "google/gemini-3-flash-preview"
+# Upper bound on videos transcribed/titled concurrently (stays under rate limits).
+OPENROUTER_MAX_CONCURRENCY = 4
 
 # --- Shared runtime defaults ---
 
@@ -164,6 +166,7 @@ VIDEO_EXTENSIONS: frozenset[str] = frozenset({
 
 SNIPPET_DIR = "snippet"
 TRANSCRIPT_DIR = "transcript"
+TRANSCRIPT_CACHE_DIR = "transcript_cache"
 TITLE_DIR = "title"
 COMPLETED_DIR = "completed"
 SCRIPTS_DIR = "scripts"
@@ -227,6 +230,7 @@ __all__ = [
     "SNIPPET_MIN_DURATION_SEC",
     "SNIPPET_MAX_DURATION_SEC",
     "OPENROUTER_DEFAULT_MODEL",
+    "OPENROUTER_MAX_CONCURRENCY",
     "TARGET_MIN_DURATION",
     "TARGET_NOISE_THRESHOLDS_DB",
     "TARGET_MIN_DURATION_START_SEC",
@@ -245,6 +249,7 @@ __all__ = [
     "VIDEO_EXTENSIONS",
     "SNIPPET_DIR",
     "TRANSCRIPT_DIR",
+    "TRANSCRIPT_CACHE_DIR",
     "TITLE_DIR",
     "COMPLETED_DIR",
     "SCRIPTS_DIR",
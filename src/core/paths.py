@@ -1,6 +1,7 @@
 """Path construction and tracking utilities."""
 
 import hashlib
+import os
 from pathlib import Path
 
 from src.core.constants import (
@@ -13,6 +14,7 @@ from src.core.constants import (
     TEXT_FILE_EXT,
     TITLE_DIR,
     TITLE_OVERLAYS_DIR,
+    TRANSCRIPT_CACHE_DIR,
     TRANSCRIPT_DIR,
     VIDEO_PROCESSING_DIR,
 )
@@ -23,6 +25,7 @@ __all__ = [
     "create_temp_subdirs",
     "get_snippet_path",
     "get_transcript_path",
+    "get_transcript_cache_path",
     "get_title_path",
     "get_font_cache_path",
     "get_title_overlay_hash",
@@ -48,6 +51,7 @@ def create_temp_subdirs(temp_dir: Path) -> None:
     for subdir in [
         SNIPPET_DIR,
         TRANSCRIPT_DIR,
+        TRANSCRIPT_CACHE_DIR,
         TITLE_DIR,
         COMPLETED_DIR,
         SCRIPTS_DIR,
@@ -67,6 +71,10 @@ def get_transcript_path(temp_dir: Path, basename: str) -> Path:
     return temp_dir / TRANSCRIPT_DIR / f"{basename}{TEXT_FILE_EXT}"
 
 
+def get_transcript_cache_path(temp_dir: Path, audio_digest: str) -> Path:
+    return temp_dir / TRANSCRIPT_CACHE_DIR / f"{audio_digest}{TEXT_FILE_EXT}"
+
+
 def get_title_path(temp_dir: Path, basename: str) -> Path:
     return temp_dir / TITLE_DIR / f"{basename}{TEXT_FILE_EXT}"
 
@@ -144,9 +152,15 @@ def mark_completed(
 
 def resolve_output_basename(title: str, output_dir: Path) -> str:
     base = sanitize_filename(title)
+    # One directory listing instead of a stat per collision probe; normcase
+    # keeps Windows' case-insensitive matching.
+    try:
+        existing = {os.path.normcase(name) for name in os.listdir(output_dir)}
+    except FileNotFoundError:
+        existing = set()
     candidate = base
     k = 0
-    while (output_dir / f"{candidate}.mp4").exists():
+    while os.path.normcase(f"{candidate}.mp4") in existing:
         k += 1
         candidate = f"{base}_{k}"
     return candidate
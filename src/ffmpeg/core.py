@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import shlex
 from pathlib import Path
 
 FFMPEG_BIN = "ffmpeg"
 FFPROBE_BIN = "ffprobe"
 
+_FFMPEG_BASE_ARGS = (FFMPEG_BIN, "-hide_banner")
+_FFMPEG_BASE_ARGS_OVERWRITE = (*_FFMPEG_BASE_ARGS, "-y")
+
 
 def build_ffmpeg_cmd(overwrite: bool = True, *additional_flags: str) -> list[str]:
     """Build a base FFmpeg command with common flags.
@@ -19,11 +21,19 @@ def build_ffmpeg_cmd(overwrite: bool = True, *additional_flags: str) -> list[str
     Returns:
         List of command tokens beginning with ffmpeg.
     """
-    cmd = [FFMPEG_BIN, "-hide_banner"]
-    if overwrite:
-        cmd.append("-y")
-    cmd.extend(additional_flags)
-    return cmd
+    base_args = _FFMPEG_BASE_ARGS_OVERWRITE if overwrite else _FFMPEG_BASE_ARGS
+    return [*base_args, *additional_flags]
+
+
+def build_audio_worker_thread_flags() -> list[str]:
+    """Build thread caps for audio-only runs that may execute in parallel.
+
+    Audio decoders and filters are effectively single-threaded, so FFmpeg's
+    default per-process thread pools (one thread per CPU) only add scheduler
+    load when several videos run at once. Place before ``-i`` so ``-threads``
+    applies to the input decoder.
+    """
+    return ["-threads", "1", "-filter_threads", "1", "-filter_complex_threads", "1"]
 
 
 def build_qsv_hwaccel_flags(device_name: str = "qsv") -> list[str]:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import re
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import Sequence
 
@@ -23,11 +24,42 @@ from sr_ffmpeg_cmd_builder import (
     build_ffprobe_stream_dimensions_command,
 )
 
+_DIMENSION_SEPARATOR_RE = re.compile(r"[, \n]")
+
+
+class _ProbeFailed(Exception):
+    """Raised inside a memoized probe so ``lru_cache`` never stores a failure."""
+
+
+def _file_identity(input_file: Path) -> tuple[str, int, int] | None:
+    """Return a cache key that changes when the file is replaced or rewritten."""
+    try:
+        stat = input_file.stat()
+    except OSError:
+        return None
+    return (str(input_file), stat.st_mtime_ns, stat.st_size)
+
+
+def _probe_has_audio_stream_uncached(input_file: Path) -> bool:
+    cmd = build_ffprobe_has_audio_command(input_file)
+    result = run(cmd, capture_output=True, check=False)
+    if result.returncode != 0:
+        raise _ProbeFailed
+    return bool(result.stdout.strip())
+
+
+@lru_cache(maxsize=256)
+def _probe_has_audio_stream_cached(file_identity: tuple[str, int, int]) -> bool:
+    return _probe_has_audio_stream_uncached(Path(file_identity[0]))
+
 
 def probe_has_audio_stream(input_file: Path) -> bool:
     """Check if file has at least one audio stream.
 
     Uses ffprobe to detect audio streams. Returns True if audio exists.
+    Successful results are memoized per file identity (path, mtime, size),
+    since silence detection asks again for every threshold it probes; a failed
+    ffprobe run answers False without being cached.
 
     Args:
         input_file: Path to media file to check
@@ -35,9 +67,13 @@ def probe_has_audio_stream(input_file: Path) -> bool:
     Returns:
         True if file has audio stream, False otherwise
     """
-    cmd = build_ffprobe_has_audio_command(input_file)
-    result = run(cmd, capture_output=True, check=False)
-    return result.returncode == 0 and bool(result.stdout.strip())
+    file_identity = _file_identity(input_file)
+    try:
+        if file_identity is None:
+            return _probe_has_audio_stream_uncached(input_file)
+        return _probe_has_audio_stream_cached(file_identity)
+    except _ProbeFailed:
+        return False
 
 
 def get_available_encoders() -> set[str]:
@@ -60,8 +96,7 @@ def get_available_encoders() -> set[str]:
     return encoders
 
 
-def probe_video_dimensions(input_file: Path) -> tuple[int, int]:
-    """Probe and return (width, height) for the first video stream."""
+def _probe_video_dimensions_uncached(input_file: Path) -> tuple[int, int]:
     result = run(build_ffprobe_stream_dimensions_command(input_file), capture_output=True, check=False)
     if result.returncode != 0:
         raise RuntimeError(f"Failed to probe dimensions for {input_file}") from None
@@ -70,7 +105,7 @@ def probe_video_dimensions(input_file: Path) -> tuple[int, int]:
     if not raw_dimensions:
         raise RuntimeError(f"Failed to read dimensions for {input_file}")
 
-    parts = [part for part in re.split(r"[, \n]", raw_dimensions) if part]
+    parts = [part for part in _DIMENSION_SEPARATOR_RE.split(raw_dimensions) if part]
     if len(parts) < 2:
         raise RuntimeError(f"Unexpected ffprobe dimensions format for {input_file}: {result.stdout}")
 
@@ -81,6 +116,23 @@ def probe_video_dimensions(input_file: Path) -> tuple[int, int]:
     return width, height
 
 
+@lru_cache(maxsize=256)
+def _probe_video_dimensions_cached(file_identity: tuple[str, int, int]) -> tuple[int, int]:
+    return _probe_video_dimensions_uncached(Path(file_identity[0]))
+
+
+def probe_video_dimensions(input_file: Path) -> tuple[int, int]:
+    """Probe and return (width, height) for the first video stream.
+
+    Memoized per file identity like ``probe_duration``; logo sizing and the
+    title overlay both ask for the same input's dimensions during one encode.
+    """
+    file_identity = _file_identity(input_file)
+    if file_identity is None:
+        return _probe_video_dimensions_uncached(input_file)
+    return _probe_video_dimensions_cached(file_identity)
+
+
 def probe_ffmpeg_can_decode_image_frame(path: Path) -> None:
     """Raise ``RuntimeError`` if FFmpeg cannot decode at least one frame.
 
@@ -102,7 +154,14 @@ def can_run_encoder(codec: str, codec_args: Sequence[str] = ()) -> bool:
 
     cmd = build_encoder_probe_command(codec, codec_args)
     try:
-        result = run(cmd, capture_output=True, check=False, timeout=30)
+        # Only the exit code matters; discard output instead of buffering it.
+        result = run(
+            cmd,
+            check=False,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=30,
+        )
     except subprocess.TimeoutExpired:
         return False
     if result.returncode != 0:
@@ -110,7 +169,7 @@ def can_run_encoder(codec: str, codec_args: Sequence[str] = ()) -> bool:
     return True
 
 
-def _run_ffprobe_float(input_file: Path, format_entry: str, fallback: float) -> float:
+def _run_ffprobe_float(input_file: Path, format_entry: str, fallback: float | None) -> float | None:
     """Run ffprobe and parse a float metadata field."""
     result = run(build_ffprobe_metadata_command(input_file, format_entry), capture_output=True, check=False)
     output = (result.stdout or "").strip()
@@ -120,9 +179,28 @@ def _run_ffprobe_float(input_file: Path, format_entry: str, fallback: float) ->
         return fallback
 
 
+@lru_cache(maxsize=256)
+def _probe_duration_cached(file_identity: tuple[str, int, int]) -> float:
+    duration = _run_ffprobe_float(Path(file_identity[0]), "duration", None)
+    if duration is None:
+        raise _ProbeFailed
+    return duration
+
+
 def probe_duration(input_file: Path) -> float:
-    """Probe media duration in seconds."""
-    return _run_ffprobe_float(input_file, "duration", 0.0)
+    """Probe media duration in seconds.
+
+    Memoized per file identity like ``probe_has_audio_stream``; trim planning,
+    silence detection, and trim-script generation each need it per video.
+    A failed probe returns 0.0 and is retried on the next call.
+    """
+    file_identity = _file_identity(input_file)
+    if file_identity is None:
+        return _run_ffprobe_float(input_file, "duration", 0.0)
+    try:
+        return _probe_duration_cached(file_identity)
+    except _ProbeFailed:
+        return 0.0
 
 
 def read_format_tags(input_file: Path) -> dict[str, str]:
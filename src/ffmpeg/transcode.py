@@ -11,16 +11,27 @@ from src.core.constants import (
     LOGO_OVERLAY_ALPHA,
     LOGO_OVERLAY_MARGIN_PX,
 )
-from src.ffmpeg.core import add_filter_complex_script, build_ffmpeg_cmd, build_qsv_hwaccel_flags
+from src.ffmpeg.core import (
+    add_filter_complex_script,
+    build_audio_worker_thread_flags,
+    build_ffmpeg_cmd,
+    build_qsv_hwaccel_flags,
+)
 from src.ffmpeg.encoding_resolver import get_encoder_config
 from sr_filter_graph import build_minimal_encode_overlay_filter_complex
 
 
-def _build_input_command(input_file: Path, *, use_qsv_hardware_path: bool = False) -> list[str]:
+def _build_input_command(
+    input_file: Path,
+    *,
+    use_qsv_hardware_path: bool = False,
+    input_flags: Sequence[str] = (),
+) -> list[str]:
     """Build an ffmpeg command with a standard output overwrite flag and input."""
     cmd = build_ffmpeg_cmd(overwrite=True)
     if use_qsv_hardware_path:
         cmd.extend(build_qsv_hwaccel_flags())
+    cmd.extend(input_flags)
     cmd.extend(["-i", str(input_file)])
     return cmd
 
@@ -55,8 +66,26 @@ def build_silence_removed_audio_command(
     acodec: Sequence[str],
     max_duration: float | None = None,
 ) -> list[str]:
-    """Build audio-only silence-removed output command."""
-    cmd = _build_input_command(input_file)
+    """Build audio-only silence-removed output command.
+
+    Video, subtitle, and data streams are dropped at the demuxer (input-side
+    ``-vn -sn -dn``) so only audio packets are read; the graph uses ``[0:a]`` only.
+    Thread pools are capped since snippets are cut for several videos at once;
+    for the same reason ``-nostats -loglevel error`` keeps concurrent jobs from
+    interleaving progress lines on the shared terminal.
+    """
+    cmd = _build_input_command(
+        input_file,
+        input_flags=(
+            "-nostats",
+            "-loglevel",
+            "error",
+            *build_audio_worker_thread_flags(),
+            "-vn",
+            "-sn",
+            "-dn",
+        ),
+    )
     add_filter_complex_script(cmd, filter_script_path)
     cmd.extend(["-map", "[outa]"])
     cmd.extend(acodec)
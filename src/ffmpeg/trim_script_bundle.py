@@ -21,6 +21,9 @@ SNIPPET_TRIM_SCRIPT_SUFFIX = ".snippet.ffscript"
 
 FinalStrategy = Literal["concat", "copy", "minimal"]
 
+# Trailing per-segment audio output label of a chain, e.g. "...[a12]".
+_AUDIO_SEGMENT_LABEL_RE = re.compile(r"\[(a\d+)\]$")
+
 
 @dataclass(frozen=True)
 class TrimScriptArtifact:
@@ -201,13 +204,10 @@ def _derive_snippet_filter_graph(final_filter_graph: str) -> str:
     audio_chains: list[str] = []
     audio_labels: list[str] = []
     for chain in chains:
-        match = re.search(r"\[([^\[\]]+)\]$", chain)
-        if match is None:
-            continue
-        label = match.group(1)
-        if re.fullmatch(r"a\d+", label):
+        match = _AUDIO_SEGMENT_LABEL_RE.search(chain)
+        if match is not None:
             audio_chains.append(chain)
-            audio_labels.append(label)
+            audio_labels.append(match.group(1))
 
     if not audio_chains:
         raise RuntimeError("Could not derive snippet trim script from final concat graph")
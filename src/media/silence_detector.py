@@ -1,55 +1,18 @@
 """Silence detection and trimming algorithm utilities."""
 
-from src.core.constants import (
-    TRIM_DECIMAL_PLACES,
-    TRIM_TIMESTAMP_EPSILON_SEC,
-)
+from src.core.constants import TRIM_TIMESTAMP_EPSILON_SEC
 
 # Re-export find_optimal_padding from new black box for backward compatibility
 from sr_threshold_selection import find_optimal_padding
 
-
-def normalize_timestamp(value: float, *, minimum: float = 0.0) -> float:
-    """Normalize a timestamp to the configured trimming precision."""
-    normalized = round(float(value), TRIM_DECIMAL_PLACES)
-    if normalized < minimum:
-        normalized = minimum
-    if normalized == -0.0:
-        normalized = 0.0
-    return normalized
-
-
-def _normalize_pair_lists(silence_starts: list[float], silence_ends: list[float], duration_sec: float) -> tuple[list[float], list[float]]:
-    starts = [normalize_timestamp(x, minimum=0.0) for x in silence_starts]
-    ends = [normalize_timestamp(x, minimum=0.0) for x in silence_ends]
-    if len(starts) > len(ends):
-        ends = list(ends) + [duration_sec]
-    elif len(starts) < len(ends):
-        ends = list(ends[: len(starts)])
-    return starts, ends
-
-
-def build_keep_segments_from_silences(
-    silence_starts: list[float],
-    silence_ends: list[float],
-    duration_sec: float,
-    pad_sec: float,
-) -> list[tuple[float, float]]:
-    """Build keep-segments from silence intervals with shared padding logic."""
-    pad_sec = normalize_timestamp(max(0.0, pad_sec))
-    duration_sec = normalize_timestamp(duration_sec)
-    silence_starts, silence_ends = _normalize_pair_lists(silence_starts, silence_ends, duration_sec)
-    segments_to_keep: list[tuple[float, float]] = []
-    prev_end = 0.0
-    for silence_start, silence_end in zip(silence_starts, silence_ends):
-        if silence_end - silence_start <= pad_sec * 2 + TRIM_TIMESTAMP_EPSILON_SEC:
-            continue
-        if silence_start > prev_end + TRIM_TIMESTAMP_EPSILON_SEC:
-            segments_to_keep.append((normalize_timestamp(prev_end), normalize_timestamp(silence_start)))
-        prev_end = normalize_timestamp(max(0.0, silence_end - pad_sec))
-    if prev_end < duration_sec - TRIM_TIMESTAMP_EPSILON_SEC:
-        segments_to_keep.append((normalize_timestamp(prev_end), normalize_timestamp(duration_sec)))
-    return segments_to_keep
+# The padding math has one implementation, in sr_threshold_selection; these
+# names keep the src.media API that trim planning and snippets import.
+from sr_threshold_selection._padding import (
+    _build_keep_segments as build_keep_segments_from_silences,
+    _calculate_resulting_length as calculate_resulting_length,
+    _normalize_pair_lists,
+    _normalize_timestamp as normalize_timestamp,
+)
 
 
 def _leading_trailing_from_edge_lists(
@@ -141,27 +104,6 @@ def trim_edge_silence(
     return starts, ends
 
 
-def calculate_resulting_length(silence_starts: list[float], silence_ends: list[float], duration_sec: float, pad_sec: float) -> float:
-    """Calculate the resulting video length after trimming silences with padding.
-    
-    Args:
-        silence_starts: List of silence start times in seconds
-        silence_ends: List of silence end times in seconds
-        duration_sec: Total video duration in seconds
-        pad_sec: Padding to retain around silences in seconds
-        
-    Returns:
-        Total length of segments to keep in seconds
-    """
-    segments_to_keep = build_keep_segments_from_silences(
-        silence_starts=silence_starts,
-        silence_ends=silence_ends,
-        duration_sec=duration_sec,
-        pad_sec=pad_sec,
-    )
-    return normalize_timestamp(sum(end - start for start, end in segments_to_keep))
-
-
 def truncate_segments_to_max_length(
     segments_to_keep: list[tuple[float, float]],
     max_length_sec: float,
@@ -21,7 +21,7 @@ from src.ffmpeg.probing import (
 )
 from sr_title_overlay import build_title_overlay
 from src.ffmpeg.transcode import build_final_trim_command
-from src.core.fs_utils import wait_for_file_release
+from src.core.fs_utils import clone_or_copy_file, wait_for_file_release
 from src.ffmpeg.core import build_ffmpeg_cmd
 from src.ffmpeg.silence_removed_runner import (
     run_silence_removed_media_with_script,
@@ -44,12 +44,30 @@ def _copy_input_video(
     temp_dir: Path,
     basename: str,
 ) -> Path:
-    """Copy input video to output using processing file → final rename pattern."""
+    """Copy input video to output using processing file → final rename pattern.
+
+    The copy carries the input's timestamps, so a re-run whose output has the
+    input's exact size and ``st_mtime_ns`` returns early instead of re-copying
+    the whole file. Any other output under that name is overwritten.
+    """
+    try:
+        input_stat = input_file.stat()
+        output_stat = output_file.stat()
+    except OSError:
+        pass
+    else:
+        if (
+            output_stat.st_size == input_stat.st_size
+            and output_stat.st_mtime_ns == input_stat.st_mtime_ns
+        ):
+            return output_file.resolve()
+
     processing_output = get_processing_video_path(temp_dir, basename)
     processing_output.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        shutil.copyfile(input_file, processing_output)
+        clone_or_copy_file(input_file, processing_output)
+        shutil.copystat(input_file, processing_output)
         _move_processing_to_final(processing_output, output_file)
         # Delete from processing after successful move
         if processing_output.exists():
@@ -66,7 +84,9 @@ def _move_processing_to_final(processing_path: Path, final_path: Path) -> None:
     On failure: raises RuntimeError, processing_path may still exist.
     """
     try:
-        processing_path.rename(final_path)
+        # replace() also overwrites an existing final file on Windows, where
+        # rename() refuses and would otherwise force the full copy below.
+        processing_path.replace(final_path)
     except OSError:
         # Rename failed (different filesystems, Windows with open handles, etc.)
         # Fallback to copy + delete
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from src.core.cli import collect_video_files, fail, require_input_dir, require_tools
-from src.core.config import get_config, load_config
+from src.core.config import get_config
 from src.core.constants import TITLE_FONT_DEFAULT, resolve_trim_defaults
 from src.core.paths import create_temp_subdirs, sibling_dir
 
@@ -40,7 +40,8 @@ def build_startup_context(args: Namespace) -> StartupContext:
     require_input_dir(input_dir)
 
     try:
-        load_config()
+        # Validate and cache in one pass; the environment is read only once.
+        config = get_config()
     except ValueError as exc:
         fail(str(exc))
 
@@ -56,7 +57,7 @@ def build_startup_context(args: Namespace) -> StartupContext:
     )
 
     pad_sec = trim_defaults.pad_sec
-    api_key = get_config()["OPENROUTER_API_KEY"]
+    api_key = config["OPENROUTER_API_KEY"]
     videos = collect_video_files(input_dir)
     if not videos:
         fail(f"No video files found in '{input_dir}'")
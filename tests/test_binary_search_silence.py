@@ -143,7 +143,7 @@ class TestPaddingBinarySearch:
     """Verify padding binary search behavior without FFmpeg re-runs."""
 
     def test_chooses_largest_valid_padding_step(self):
-        pad_sec = binary_search_padding(
+        pad_sec, _ = binary_search_padding(
             target_length=10.0,
             duration_sec=5.0,
             estimate_length=lambda pad_sec: 9.60 + pad_sec,
@@ -151,8 +151,17 @@ class TestPaddingBinarySearch:
 
         assert pad_sec == pytest.approx(0.400)
 
+    def test_returns_estimated_length_of_chosen_padding(self):
+        pad_sec, length = binary_search_padding(
+            target_length=10.0,
+            duration_sec=5.0,
+            estimate_length=lambda pad_sec: 9.60 + pad_sec,
+        )
+
+        assert length == pytest.approx(9.60 + pad_sec)
+
     def test_returns_base_padding_when_no_expansion_is_possible(self):
-        pad_sec = binary_search_padding(
+        pad_sec, _ = binary_search_padding(
             target_length=9.769,
             duration_sec=5.0,
             estimate_length=lambda pad_sec: 9.70 + pad_sec,
@@ -166,7 +175,7 @@ class TestPaddingBinarySearch:
                 return None
             return 9.50 + pad_sec
 
-        pad_sec = binary_search_padding(
+        pad_sec, _ = binary_search_padding(
             target_length=10.0,
             duration_sec=5.0,
             estimate_length=estimate_length,
@@ -175,10 +184,11 @@ class TestPaddingBinarySearch:
         assert pad_sec == pytest.approx(0.360)
 
     def test_invalid_base_padding_returns_default(self):
-        pad_sec = binary_search_padding(
+        pad_sec, length = binary_search_padding(
             target_length=10.0,
             duration_sec=5.0,
             estimate_length=lambda _pad_sec: None,
         )
 
         assert pad_sec == TARGET_SEARCH_BASE_PADDING_SEC
+        assert length is None
@@ -34,6 +34,13 @@ def test_parse_args_accepts_non_target_names(monkeypatch, tmp_path):
     assert parsed.non_target_pad_sec == 0.5
 
 
+def test_parse_args_jobs_defaults_to_none_and_rejects_zero(monkeypatch, tmp_path):
+    assert _parse_args_with(monkeypatch, [str(tmp_path)]).jobs is None
+    assert _parse_args_with(monkeypatch, [str(tmp_path), "--jobs", "3"]).jobs == 3
+    with pytest.raises(SystemExit):
+        _parse_args_with(monkeypatch, [str(tmp_path), "--jobs", "0"])
+
+
 @pytest.mark.parametrize(
     "flag, value",
     [
@@ -71,7 +78,6 @@ def test_startup_context_reads_non_target_trim_flags(monkeypatch, tmp_path):
 
     monkeypatch.setattr(bootstrap, "require_tools", lambda *_tools: None)
     monkeypatch.setattr(bootstrap, "require_input_dir", lambda _path: None)
-    monkeypatch.setattr(bootstrap, "load_config", lambda: {"OPENROUTER_API_KEY": "x"})
     monkeypatch.setattr(bootstrap, "get_config", lambda: {"OPENROUTER_API_KEY": "x"})
     monkeypatch.setattr(bootstrap, "collect_video_files", lambda _input_dir: fake_inputs)
     monkeypatch.setattr(bootstrap, "resolve_trim_defaults", fake_resolve_trim_defaults)
@@ -96,3 +102,37 @@ def test_startup_context_reads_non_target_trim_flags(monkeypatch, tmp_path):
     assert captured["min_duration"] == 1.7
     assert captured["pad_sec"] == 0.8
     assert captured["target_length"] is None
+
+
+def test_require_videos_in_stops_at_first_unlocked_video(monkeypatch, tmp_path):
+    (tmp_path / "a.mp4").write_bytes(b"")
+    (tmp_path / "b.mp4").write_bytes(b"")
+    (tmp_path / "notes.txt").write_text("x")
+
+    probed = []
+    monkeypatch.setattr(cli, "is_file_locked", lambda path: probed.append(path.name) or False)
+
+    cli.require_videos_in(tmp_path)
+
+    assert len(probed) == 1
+
+
+def test_require_videos_in_fails_when_only_locked_videos(monkeypatch, tmp_path):
+    (tmp_path / "a.mp4").write_bytes(b"")
+    monkeypatch.setattr(cli, "is_file_locked", lambda path: True)
+
+    with pytest.raises(SystemExit):
+        cli.require_videos_in(tmp_path)
+
+
+def test_require_tools_looks_up_each_tool_once(monkeypatch):
+    lookups = []
+    monkeypatch.setattr(cli.shutil, "which", lambda tool: lookups.append(tool) or f"/bin/{tool}")
+    cli._which.cache_clear()
+    try:
+        cli.require_tools("ffmpeg", "ffprobe")
+        cli.require_tools("ffmpeg", "ffprobe")
+    finally:
+        cli._which.cache_clear()
+
+    assert lookups == ["ffmpeg", "ffprobe"]
@@ -0,0 +1,103 @@
+"""Tests for ffprobe-backed media probes."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.ffmpeg import probing
+
+
+def _fake_run(calls: list[list[str]], stdout: str):
+    def _run(cmd, **_kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout=stdout, stderr="")
+
+    return _run
+
+
+def test_probe_duration_is_memoized_until_file_changes(monkeypatch, tmp_path: Path) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"aaaa")
+    calls: list[list[str]] = []
+    monkeypatch.setattr(probing, "run", _fake_run(calls, "12.5\n"))
+    probing._probe_duration_cached.cache_clear()
+
+    assert probing.probe_duration(media) == 12.5
+    assert probing.probe_duration(media) == 12.5
+    assert len(calls) == 1
+
+    media.write_bytes(b"bbbbbbbb")
+    os.utime(media, ns=(1, 1))
+    assert probing.probe_duration(media) == 12.5
+    assert len(calls) == 2
+
+
+def test_probe_has_audio_stream_is_memoized(monkeypatch, tmp_path: Path) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"aaaa")
+    calls: list[list[str]] = []
+    monkeypatch.setattr(probing, "run", _fake_run(calls, "0\n"))
+    probing._probe_has_audio_stream_cached.cache_clear()
+
+    assert probing.probe_has_audio_stream(media) is True
+    assert probing.probe_has_audio_stream(media) is True
+    assert len(calls) == 1
+
+
+def test_probe_video_dimensions_is_memoized(monkeypatch, tmp_path: Path) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"aaaa")
+    calls: list[list[str]] = []
+    monkeypatch.setattr(probing, "run", _fake_run(calls, "1920,1080\n"))
+    probing._probe_video_dimensions_cached.cache_clear()
+
+    assert probing.probe_video_dimensions(media) == (1920, 1080)
+    assert probing.probe_video_dimensions(media) == (1920, 1080)
+    assert len(calls) == 1
+
+
+def _fake_run_sequence(calls: list[list[str]], results: list[tuple[int, str]]):
+    def _run(cmd, **_kwargs):
+        calls.append(cmd)
+        returncode, stdout = results[len(calls) - 1]
+        return SimpleNamespace(returncode=returncode, stdout=stdout, stderr="")
+
+    return _run
+
+
+def test_probe_duration_does_not_memoize_failed_probe(monkeypatch, tmp_path: Path) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"aaaa")
+    calls: list[list[str]] = []
+    monkeypatch.setattr(probing, "run", _fake_run_sequence(calls, [(1, ""), (0, "12.5\n"), (0, "99\n")]))
+    probing._probe_duration_cached.cache_clear()
+
+    assert probing.probe_duration(media) == 0.0
+    assert probing.probe_duration(media) == 12.5
+    assert probing.probe_duration(media) == 12.5
+    assert len(calls) == 2
+
+
+def test_probe_has_audio_stream_does_not_memoize_failed_probe(monkeypatch, tmp_path: Path) -> None:
+    media = tmp_path / "clip.mp4"
+    media.write_bytes(b"aaaa")
+    calls: list[list[str]] = []
+    monkeypatch.setattr(probing, "run", _fake_run_sequence(calls, [(1, ""), (0, "0\n")]))
+    probing._probe_has_audio_stream_cached.cache_clear()
+
+    assert probing.probe_has_audio_stream(media) is False
+    assert probing.probe_has_audio_stream(media) is True
+    assert probing.probe_has_audio_stream(media) is True
+    assert len(calls) == 2
+
+
+def test_probe_duration_skips_memo_for_missing_file(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(probing, "run", _fake_run(calls, "3\n"))
+
+    missing = tmp_path / "missing.mp4"
+    assert probing.probe_duration(missing) == 3.0
+    assert probing.probe_duration(missing) == 3.0
+    assert len(calls) == 2
@@ -27,6 +27,33 @@ def test_audio_trim_command_maps_only_audio_output(tmp_path: Path) -> None:
     assert cmd[-1] == str(output_audio)
 
 
+def test_audio_trim_command_drops_non_audio_streams_at_input(tmp_path: Path) -> None:
+    cmd = build_silence_removed_audio_command(
+        input_file=Path("input.mkv"),
+        output_audio_path=tmp_path / "snippet.ogg",
+        filter_script_path=tmp_path / "audio_only.ffscript",
+        acodec=["-c:a", "libopus"],
+    )
+
+    input_index = cmd.index("-i")
+    assert cmd[input_index - 3 : input_index] == ["-vn", "-sn", "-dn"]
+
+
+def test_audio_trim_command_caps_ffmpeg_threads_before_input(tmp_path: Path) -> None:
+    cmd = build_silence_removed_audio_command(
+        input_file=Path("input.mkv"),
+        output_audio_path=tmp_path / "snippet.ogg",
+        filter_script_path=tmp_path / "audio_only.ffscript",
+        acodec=["-c:a", "libopus"],
+    )
+
+    input_index = cmd.index("-i")
+    for flag in ("-threads", "-filter_threads", "-filter_complex_threads"):
+        flag_index = cmd.index(flag)
+        assert flag_index < input_index
+        assert cmd[flag_index + 1] == "1"
+
+
 def test_audio_trim_command_has_no_null_muxer_fallback(tmp_path: Path) -> None:
     output_audio = tmp_path / "snippet.ogg"
     cmd = build_silence_removed_audio_command(
@@ -39,3 +66,18 @@ def test_audio_trim_command_has_no_null_muxer_fallback(tmp_path: Path) -> None:
     assert cmd.count("-map") == 1
     assert "null" not in cmd
     assert cmd[-1] == str(output_audio)
+
+
+def test_audio_trim_command_silences_progress_for_concurrent_jobs(tmp_path: Path) -> None:
+    cmd = build_silence_removed_audio_command(
+        input_file=Path("input.mkv"),
+        output_audio_path=tmp_path / "snippet.ogg",
+        filter_script_path=tmp_path / "audio_only.ffscript",
+        acodec=["-c:a", "libopus"],
+    )
+
+    input_index = cmd.index("-i")
+    assert cmd.index("-nostats") < input_index
+    loglevel_index = cmd.index("-loglevel")
+    assert loglevel_index < input_index
+    assert cmd[loglevel_index + 1] == "error"
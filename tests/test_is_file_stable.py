@@ -10,9 +10,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "packages"))
 
 import pytest
 
-from src.core.cli import collect_video_files
+from src.core.cli import _has_video_extension, collect_video_files
 from src.core.constants import VIDEO_EXTENSIONS
-from src.core.fs_utils import is_file_locked
+from src.core.fs_utils import clone_or_copy_file, is_file_locked
 
 
 class TestIsFileLocked:
@@ -114,6 +114,37 @@ class TestCollectVideoFiles:
 
         assert [p.name for p in result] == ["video.mp4"]
 
+    def test_matches_uppercase_suffix_and_skips_video_named_directory(self, tmp_path):
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+
+        (input_dir / "CLIP.MP4").write_text("v")
+        (input_dir / "folder.mkv").mkdir()
+
+        with patch("src.core.cli.is_file_locked", return_value=False):
+            result = collect_video_files(input_dir)
+
+        assert result == [input_dir / "CLIP.MP4"]
+
+
+class TestHasVideoExtension:
+    """Test the bare-name extension check used on scandir entries."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("clip.mp4", True),
+            ("CLIP.MKV", True),
+            ("archive.tar.ts", True),
+            ("notes.txt", False),
+            ("noext", False),
+            (".mp4", False),
+        ],
+    )
+    def test_matches_path_suffix_semantics(self, name, expected):
+        assert _has_video_extension(name) is expected
+        assert (Path(name).suffix.lower() in VIDEO_EXTENSIONS) is expected
+
 
 class TestVideoExtensionsCoverage:
     """Test that all configured video extensions are recognized."""
@@ -143,5 +174,43 @@ class TestEdgeCases:
         assert result == []
 
 
+class TestCloneOrCopyFile:
+    """Test reflink-first file copying."""
+
+    def test_copies_contents(self, tmp_path):
+        src = tmp_path / "src.mp4"
+        dst = tmp_path / "dst.mp4"
+        src.write_bytes(b"video-bytes")
+
+        clone_or_copy_file(src, dst)
+
+        assert dst.read_bytes() == b"video-bytes"
+
+    def test_falls_back_to_copyfile_when_reflink_unsupported(self, tmp_path):
+        src = tmp_path / "src.mp4"
+        dst = tmp_path / "dst.mp4"
+        src.write_bytes(b"video-bytes")
+
+        with patch("src.core.fs_utils._try_reflink", return_value=False) as reflink:
+            clone_or_copy_file(src, dst)
+
+        reflink.assert_called_once_with(src, dst)
+        assert dst.read_bytes() == b"video-bytes"
+
+    def test_skips_ficlone_ioctl_off_linux(self, tmp_path):
+        src = tmp_path / "src.mp4"
+        dst = tmp_path / "dst.mp4"
+        src.write_bytes(b"video-bytes")
+
+        with (
+            patch("src.core.fs_utils.sys.platform", "darwin"),
+            patch("src.core.fs_utils.fcntl") as fcntl_module,
+        ):
+            clone_or_copy_file(src, dst)
+
+        fcntl_module.ioctl.assert_not_called()
+        assert dst.read_bytes() == b"video-bytes"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""Tests for copy-through handling in final trim output."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from src.media import trim
+
+
+def _count_copies(monkeypatch) -> list[Path]:
+    copies: list[Path] = []
+    clone_or_copy_file = trim.clone_or_copy_file
+
+    def _counting_copy(src: Path, dst: Path) -> None:
+        copies.append(src)
+        clone_or_copy_file(src, dst)
+
+    monkeypatch.setattr(trim, "clone_or_copy_file", _counting_copy)
+    return copies
+
+
+def _copy(input_file: Path, output_file: Path, temp_dir: Path) -> Path:
+    return trim._copy_input_video(
+        input_file=input_file,
+        output_file=output_file,
+        temp_dir=temp_dir,
+        basename=input_file.stem,
+    )
+
+
+def test_copy_input_video_skips_output_already_copied_from_input(monkeypatch, tmp_path: Path) -> None:
+    input_file = tmp_path / "in.mp4"
+    output_file = tmp_path / "out" / "Title.mp4"
+    output_file.parent.mkdir()
+    input_file.write_bytes(b"video bytes")
+    os.utime(input_file, ns=(1_000_000_000, 1_000_000_000))
+    copies = _count_copies(monkeypatch)
+
+    _copy(input_file, output_file, tmp_path / "temp")
+    _copy(input_file, output_file, tmp_path / "temp")
+
+    assert len(copies) == 1
+    assert output_file.read_bytes() == b"video bytes"
+    assert output_file.stat().st_mtime_ns == input_file.stat().st_mtime_ns
+
+
+def test_copy_input_video_overwrites_same_size_output_from_other_file(monkeypatch, tmp_path: Path) -> None:
+    input_file = tmp_path / "in.mp4"
+    output_file = tmp_path / "out" / "Title.mp4"
+    output_file.parent.mkdir()
+    input_file.write_bytes(b"new video!!")
+    output_file.write_bytes(b"old video!!")
+    os.utime(input_file, ns=(1_000_000_000, 1_000_000_000))
+    copies = _count_copies(monkeypatch)
+
+    _copy(input_file, output_file, tmp_path / "temp")
+
+    assert len(copies) == 1
+    assert output_file.read_bytes() == b"new video!!"
+
+
+def test_copy_input_video_recopies_input_restored_with_older_mtime(monkeypatch, tmp_path: Path) -> None:
+    input_file = tmp_path / "in.mp4"
+    output_file = tmp_path / "out" / "Title.mp4"
+    output_file.parent.mkdir()
+    input_file.write_bytes(b"first take")
+    os.utime(input_file, ns=(2_000_000_000, 2_000_000_000))
+    copies = _count_copies(monkeypatch)
+    _copy(input_file, output_file, tmp_path / "temp")
+
+    input_file.write_bytes(b"other take")
+    os.utime(input_file, ns=(1_000_000_000, 1_000_000_000))
+    _copy(input_file, output_file, tmp_path / "temp")
+
+    assert len(copies) == 2
+    assert output_file.read_bytes() == b"other take"
@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 import re
+import threading
 
 # Setup paths for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -366,6 +367,49 @@ class TestLoggingFunctions:
         assert "rate_limited" in content
         assert "Too many requests" in content
 
+    def test_concurrent_requests_keep_separate_log_files(self, tmp_path):
+        """Test that requests logged in the same instant do not overwrite each other."""
+        barrier = threading.Barrier(2)
+
+        def send(**kwargs):
+            barrier.wait(timeout=5)
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = f"reply to {kwargs['messages'][0]['content']}"
+            return response
+
+        with patch("openrouter_transport.client.OpenRouter") as mock_client_class, \
+                patch("openrouter_transport.client.time.time_ns", return_value=1_700_000_000_000_000_000):
+            mock_client = MagicMock()
+            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_client.chat.send.side_effect = send
+
+            threads = [
+                threading.Thread(
+                    target=request,
+                    kwargs={
+                        "api_key": "test-key",
+                        "model": "test-model",
+                        "messages": [{"role": "user", "content": prompt}],
+                        "log_dir": tmp_path,
+                    },
+                )
+                for prompt in ("first", "second")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        logs_dir = tmp_path / "logs"
+        requests_logged = sorted(p.read_text() for p in logs_dir.glob("*_request.txt"))
+        responses_logged = sorted(p.read_text() for p in logs_dir.glob("*_response.txt"))
+        assert len(requests_logged) == 2
+        assert len(responses_logged) == 2
+        assert "first" in requests_logged[0] and "second" in requests_logged[1]
+        assert "reply to first" in responses_logged[0]
+        assert "reply to second" in responses_logged[1]
+
 
 class TestMaxInputTokensFallback:
     """Test special handling for max_input_tokens rejection."""
@@ -447,5 +491,31 @@ class TestListContentHandling:
             assert result == "First part. Second part."
 
 
+class TestConnectionReuse:
+    """Test that SDK clients share one HTTP connection pool."""
+
+    def test_requests_reuse_shared_http_clients(self):
+        """Test that every request hands the same httpx clients to the SDK."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "ok"
+
+        with patch("openrouter_transport.client.OpenRouter") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_client.chat.send.return_value = mock_response
+
+            for _ in range(2):
+                request(
+                    api_key="test-key",
+                    model="test-model",
+                    messages=[{"role": "user", "content": "Hello"}],
+                )
+
+            first, second = mock_client_class.call_args_list
+            assert first.kwargs["client"] is second.kwargs["client"]
+            assert first.kwargs["async_client"] is second.kwargs["async_client"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
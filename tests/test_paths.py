@@ -0,0 +1,19 @@
+"""Tests for output path helpers."""
+
+from src.core.paths import resolve_output_basename
+
+
+def test_resolve_output_basename_returns_sanitized_title_when_free(tmp_path):
+    assert resolve_output_basename("My Title", tmp_path) == "My Title"
+
+
+def test_resolve_output_basename_skips_existing_outputs(tmp_path):
+    (tmp_path / "My Title.mp4").write_text("x")
+    (tmp_path / "My Title_1.mp4").write_text("x")
+    (tmp_path / "My Title_3.mp4").write_text("x")
+
+    assert resolve_output_basename("My Title", tmp_path) == "My Title_2"
+
+
+def test_resolve_output_basename_handles_missing_output_dir(tmp_path):
+    assert resolve_output_basename("My Title", tmp_path / "missing") == "My Title"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import sys
+import time
 from io import StringIO
 from pathlib import Path
 
@@ -198,3 +199,61 @@ def test_run_phase_step_reports_failure_with_current_output(monkeypatch) -> None
         "  failed: broken.mkv (boom)\n"
         "Traceback line 1\nTraceback line 2\n"
     ) == stream.getvalue()
+
+
+def test_run_phase_parallel_counts_results_and_keeps_skip_order(monkeypatch) -> None:
+    stream = _FakeStream(is_tty=False)
+    monkeypatch.setattr(sys, "stdout", stream)
+    monkeypatch.setattr(pipeline, "_PHASE_PROGRESS", None)
+
+    def _run(video_file: Path, vi: int, vn: int) -> bool | None:
+        if video_file.name == "c.mkv":
+            raise RuntimeError("boom")
+        return video_file.name != "d.mkv"
+
+    phase = pipeline._PipelinePhase(
+        index=0,
+        label="Trim Script Generation",
+        run=_run,
+        skip_reason=lambda video_file: "already generated" if video_file.name == "a.mkv" else None,
+        max_workers=4,
+    )
+
+    videos = [Path(name) for name in ("a.mkv", "b.mkv", "c.mkv", "d.mkv", "e.mkv")]
+    result = pipeline._run_phase(videos, phase)
+
+    assert result == (2, 1, 2)
+    output = stream.getvalue()
+    assert output.startswith("\n  skip: a.mkv (already generated)\n")
+    assert "  failed: c.mkv (boom)\n" in output
+
+
+def test_parallel_phase_steps_write_whole_progress_blocks(monkeypatch) -> None:
+    class _SlowStream(_FakeStream):
+        def write(self, text: str) -> int:
+            # Yield mid-write so unsynchronized workers would interleave.
+            time.sleep(0.001)
+            return super().write(text)
+
+    stream = _SlowStream(is_tty=True)
+    monkeypatch.setattr(sys, "stdout", stream)
+    monkeypatch.setattr(pipeline, "_PHASE_PROGRESS", None)
+
+    def _run(video_file: Path, vi: int, vn: int) -> bool | None:
+        return pipeline._run_phase_step(video_file, lambda: None, vi, vn, "Snippet Creation")
+
+    phase = pipeline._PipelinePhase(index=1, label="Snippet Creation", run=_run, max_workers=4)
+    videos = [Path(f"{name}.mkv") for name in "abcdefgh"]
+
+    result = pipeline._run_phase(videos, phase)
+
+    assert result == (8, 0, 0)
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == ""
+    blocks = lines[1:]
+    assert len(blocks) == 16
+    for processing, progress in zip(blocks[::2], blocks[1::2]):
+        name = processing.removeprefix("  processing: ")
+        assert processing != name
+        assert progress.startswith("[Snippet Creation] File ")
+        assert progress.endswith(f": {name}")
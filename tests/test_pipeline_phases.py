@@ -0,0 +1,154 @@
+"""Tests for pipeline phase gating and per-phase helpers."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from src.app import pipeline
+from src.startup import StartupContext
+
+
+def _collect_phases(monkeypatch, tmp_path: Path, video: Path) -> dict[int, pipeline._PipelinePhase]:
+    output_dir = tmp_path / "output"
+    startup = StartupContext(
+        input_dir=video.parent,
+        output_dir=output_dir,
+        temp_dir=output_dir / "temp",
+        videos=[video],
+        noise_threshold=-30.0,
+        min_duration=0.5,
+        pad_sec=0.1,
+        target_length=None,
+        api_key="key",
+        title_font="Arial",
+        enable_title_overlay=False,
+        enable_logo_overlay=False,
+    )
+    phases: dict[int, pipeline._PipelinePhase] = {}
+    monkeypatch.setattr(pipeline, "build_startup_context", lambda _args: startup)
+    monkeypatch.setattr(pipeline, "is_trim_script_ready", lambda **_kwargs: True)
+    monkeypatch.setattr(
+        pipeline,
+        "_run_phase",
+        lambda *, videos, phase: phases.setdefault(phase.index, phase),
+    )
+
+    pipeline.run(argparse.Namespace(jobs=1, encoder=None, enable_media_manager=False))
+    return phases
+
+
+def _write_artifact(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_transcription_skipped_when_title_exists_without_transcript(monkeypatch, tmp_path: Path) -> None:
+    video = tmp_path / "input" / "clip.mkv"
+    phases = _collect_phases(monkeypatch, tmp_path, video)
+    temp_dir = tmp_path / "output" / "temp"
+    _write_artifact(pipeline.get_snippet_path(temp_dir, "clip"), "ogg")
+
+    assert phases[2].skip_reason(video) is None
+
+    _write_artifact(pipeline.get_title_path(temp_dir, "clip"), "My Title")
+
+    assert phases[2].skip_reason(video) == "title already exists"
+    assert phases[3].skip_reason(video) == "title already exists"
+
+
+def test_final_encode_does_not_require_transcript(monkeypatch, tmp_path: Path) -> None:
+    video = tmp_path / "input" / "clip.mkv"
+    phases = _collect_phases(monkeypatch, tmp_path, video)
+    temp_dir = tmp_path / "output" / "temp"
+
+    assert phases[7].skip_reason(video) == "title missing (run phase 3 first)"
+
+    _write_artifact(pipeline.get_title_path(temp_dir, "clip"), "My Title")
+
+    assert not pipeline.get_transcript_path(temp_dir, "clip").exists()
+    assert phases[7].skip_reason(video) is None
+
+
+def test_title_generation_waits_for_transcript(monkeypatch, tmp_path: Path) -> None:
+    video = tmp_path / "input" / "clip.mkv"
+    phases = _collect_phases(monkeypatch, tmp_path, video)
+    temp_dir = tmp_path / "output" / "temp"
+
+    assert phases[3].skip_reason(video) == "transcript missing (run phase 2 first)"
+
+    _write_artifact(pipeline.get_transcript_path(temp_dir, "clip"), "hello")
+
+    assert phases[3].skip_reason(video) is None
+
+
+def _record_transcriptions(monkeypatch) -> list[Path]:
+    api_calls: list[Path] = []
+
+    def _fake_transcribe_and_save(*, api_key, audio_path, output_path, model, log_dir):
+        api_calls.append(audio_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(f"transcript of {audio_path.name}", encoding="utf-8")
+
+    monkeypatch.setattr(pipeline, "transcribe_and_save", _fake_transcribe_and_save)
+    return api_calls
+
+
+def test_transcribe_media_reuses_transcript_for_identical_audio(monkeypatch, tmp_path: Path) -> None:
+    temp_dir = tmp_path / "temp"
+    snippet_a = tmp_path / "a.ogg"
+    snippet_b = tmp_path / "b.ogg"
+    snippet_a.write_bytes(b"same audio")
+    snippet_b.write_bytes(b"same audio")
+    api_calls = _record_transcriptions(monkeypatch)
+
+    pipeline.transcribe_media(snippet_a, temp_dir, "key", "a")
+    pipeline.transcribe_media(snippet_b, temp_dir, "key", "b")
+
+    assert api_calls == [snippet_a]
+    assert pipeline.get_transcript_path(temp_dir, "b").read_text(encoding="utf-8") == "transcript of a.ogg"
+
+
+def test_transcribe_media_calls_api_for_different_audio(monkeypatch, tmp_path: Path) -> None:
+    temp_dir = tmp_path / "temp"
+    snippet_a = tmp_path / "a.ogg"
+    snippet_b = tmp_path / "b.ogg"
+    snippet_a.write_bytes(b"first audio")
+    snippet_b.write_bytes(b"other audio")
+    api_calls = _record_transcriptions(monkeypatch)
+
+    pipeline.transcribe_media(snippet_a, temp_dir, "key", "a")
+    pipeline.transcribe_media(snippet_b, temp_dir, "key", "b")
+
+    assert api_calls == [snippet_a, snippet_b]
+    assert pipeline.get_transcript_path(temp_dir, "b").read_text(encoding="utf-8") == "transcript of b.ogg"
+
+
+def test_transcribe_media_without_cache_calls_api_and_refreshes_entry(monkeypatch, tmp_path: Path) -> None:
+    temp_dir = tmp_path / "temp"
+    snippet = tmp_path / "a.ogg"
+    snippet.write_bytes(b"same audio")
+    api_calls = _record_transcriptions(monkeypatch)
+    pipeline.transcribe_media(snippet, temp_dir, "key", "a")
+    cache_dir = pipeline.get_transcript_cache_path(temp_dir, "x").parent
+    (cache_entry,) = cache_dir.iterdir()
+    cache_entry.write_text("stale transcript", encoding="utf-8")
+
+    pipeline.transcribe_media(snippet, temp_dir, "key", "a", use_cache=False)
+
+    assert api_calls == [snippet, snippet]
+    assert [path.name for path in cache_dir.iterdir()] == [cache_entry.name]
+    assert cache_entry.read_text(encoding="utf-8") == "transcript of a.ogg"
+
+
+def test_transcribe_media_cache_key_includes_model(monkeypatch, tmp_path: Path) -> None:
+    temp_dir = tmp_path / "temp"
+    snippet = tmp_path / "a.ogg"
+    snippet.write_bytes(b"same audio")
+    api_calls = _record_transcriptions(monkeypatch)
+
+    pipeline.transcribe_media(snippet, temp_dir, "key", "a")
+    monkeypatch.setattr(pipeline, "DEFAULT_MODEL", "other/model")
+    pipeline.transcribe_media(snippet, temp_dir, "key", "b")
+
+    assert api_calls == [snippet, snippet]
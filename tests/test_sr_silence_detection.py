@@ -167,3 +167,136 @@ class TestBlackBoxApi:
         )
         assert isinstance(result, tuple)
         assert len(result) == 2
+
+
+class TestDetectionCache:
+    """Test the on-disk primary detection cache."""
+
+    def test_repeated_probes_reuse_parsed_cache(self, tmp_path, monkeypatch):
+        import json as json_module
+
+        from sr_silence_detection import _cache
+
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x" * 16)
+        temp_dir = tmp_path / "temp"
+
+        _cache.save_primary_detection(temp_dir, "clip", media, [1.0], [2.0], 10.0, -30.0, 0.5)
+
+        loads = []
+        original_loads = json_module.loads
+        monkeypatch.setattr(_cache.json, "loads", lambda data: loads.append(1) or original_loads(data))
+
+        for threshold in (-31.0, -32.0, -33.0):
+            assert _cache.get_cached_primary_detection(temp_dir, "clip", media, threshold, 0.5) is None
+            _cache.save_primary_detection(temp_dir, "clip", media, [1.0], [2.0], 10.0, threshold, 0.5)
+
+        assert loads == []
+        cached = _cache.get_cached_primary_detection(temp_dir, "clip", media, -33.0, 0.5)
+        assert cached == ([1.0], [2.0], 10.0)
+
+        on_disk = json_module.loads(_cache._get_cache_path(temp_dir, "clip").read_text(encoding="utf-8"))
+        assert len(on_disk["primary_cache"]) == 4
+
+    def test_returned_lists_do_not_alias_cache(self, tmp_path):
+        from sr_silence_detection import _cache
+
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x" * 16)
+        temp_dir = tmp_path / "temp"
+        _cache.save_primary_detection(temp_dir, "clip", media, [1.0], [2.0], 10.0, -30.0, 0.5)
+
+        starts, _ends, _duration = _cache.get_cached_primary_detection(temp_dir, "clip", media, -30.0, 0.5)
+        starts.append(99.0)
+
+        again = _cache.get_cached_primary_detection(temp_dir, "clip", media, -30.0, 0.5)
+        assert again[0] == [1.0]
+
+    def test_cache_write_replaces_file_atomically(self, tmp_path):
+        from sr_silence_detection import _cache
+
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x" * 16)
+        temp_dir = tmp_path / "temp"
+        _cache.save_primary_detection(temp_dir, "clip", media, [1.0], [2.0], 10.0, -30.0, 0.5)
+
+        cache_path = _cache._get_cache_path(temp_dir, "clip")
+        assert [p.name for p in cache_path.parent.iterdir()] == [cache_path.name]
+
+    def test_loaded_cache_data_does_not_alias_memo(self, tmp_path):
+        from sr_silence_detection import _cache
+
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x" * 16)
+        temp_dir = tmp_path / "temp"
+        _cache.save_primary_detection(temp_dir, "clip", media, [1.0], [2.0], 10.0, -30.0, 0.5)
+
+        cache_path = _cache._get_cache_path(temp_dir, "clip")
+        _cache._load_cache_data(cache_path)["primary_cache"].clear()
+
+        assert _cache.get_cached_primary_detection(temp_dir, "clip", media, -30.0, 0.5) == ([1.0], [2.0], 10.0)
+
+    def test_concurrent_saves_leave_one_valid_cache_file(self, tmp_path):
+        import json as json_module
+        from concurrent.futures import ThreadPoolExecutor
+
+        from sr_silence_detection import _cache
+
+        media = tmp_path / "clip.mp4"
+        media.write_bytes(b"x" * 16)
+        temp_dir = tmp_path / "temp"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(
+                    _cache.save_primary_detection,
+                    temp_dir, "clip", media, [1.0], [2.0], 10.0, float(threshold), 0.5,
+                )
+                for threshold in range(-60, -20)
+            ]
+        for future in futures:
+            future.result()
+
+        cache_path = _cache._get_cache_path(temp_dir, "clip")
+        assert [p.name for p in cache_path.parent.iterdir()] == [cache_path.name]
+        assert json_module.loads(cache_path.read_text(encoding="utf-8"))["primary_cache"]
+
+
+class TestSilenceLogParsing:
+    """Test parsing of silencedetect stderr."""
+
+    DUAL_LOG = "\n".join(
+        [
+            "[silencedetect @ 0xaaa] silence_start: 0",
+            "[silencedetect @ 0xbbb] silence_start: -0.01",
+            "[silencedetect @ 0xaaa] silence_end: 1.5 | silence_duration: 1.5",
+            "size=N/A time=00:00:02.00 bitrate=N/A",
+            "[silencedetect @ 0xaaa] silence_start: 4.25",
+            "[silencedetect @ 0xbbb] silence_end: 0.8 | silence_duration: 0.81",
+            "[silencedetect @ 0xaaa] silence_end: 6 | silence_duration: 1.75",
+        ]
+    )
+
+    def test_single_pass_parse_keeps_order(self):
+        from sr_silence_detection._parsers import _parse_silence_output
+
+        starts, ends = _parse_silence_output(
+            "silence_start: 0\nsilence_end: 1.5 | silence_duration: 1.5\nsilence_start: 4.25\n"
+        )
+
+        assert starts == [0.0, 4.25]
+        assert ends == [1.5]
+
+    def test_dual_parse_buckets_by_filter_pointer(self):
+        from sr_silence_detection._parsers import _parse_dual_silence_output
+
+        primary, edge, ok = _parse_dual_silence_output(self.DUAL_LOG)
+
+        assert ok is True
+        assert primary == ([0.0, 4.25], [1.5, 6.0])
+        assert edge == ([-0.01], [0.8])
+
+    def test_dual_parse_requires_two_filters(self):
+        from sr_silence_detection._parsers import _parse_dual_silence_output
+
+        assert _parse_dual_silence_output("[silencedetect @ 0xaaa] silence_start: 1") == (([], []), ([], []), False)
@@ -164,6 +164,73 @@ def test_find_optimal_padding_already_at_target():
     print("  ✓ Returns 0 when already at target")
 
 
+def test_find_optimal_padding_matches_linear_grid_scan():
+    """Test that the bisected padding equals the first-miss step of a full grid scan."""
+    print("\n--- Test: Padding bisection matches grid scan ---")
+    from sr_threshold_selection._padding import _calculate_resulting_length
+    from src.core.constants import MAX_PAD_SEC, PAD_INCREMENT_SEC, TRIM_DECIMAL_PLACES
+
+    starts = [5.0, 20.0, 31.5, 48.0, 70.25]
+    ends = [9.0, 26.0, 33.0, 60.0, 71.0]
+    duration = 80.0
+
+    for target in (56.0, 60.0, 63.3, 70.0, 75.0, 79.0):
+        expected = 0.0
+        for step in range(int(MAX_PAD_SEC / PAD_INCREMENT_SEC + TRIM_TIMESTAMP_EPSILON_SEC) + 1):
+            current_pad = round(min(MAX_PAD_SEC, step * PAD_INCREMENT_SEC), TRIM_DECIMAL_PLACES)
+            if _calculate_resulting_length(starts, ends, duration, current_pad) < target - TRIM_TIMESTAMP_EPSILON_SEC:
+                expected = current_pad
+                continue
+            break
+
+        assert find_optimal_padding(starts, ends, duration, target) == expected
+    print("  ✓ Bisection matches grid scan")
+
+
+def test_find_optimal_padding_unsorted_input_uses_grid_scan():
+    """Test that unsorted or overlapping silences keep the step-by-step result."""
+    print("\n--- Test: Unsorted silences fall back to grid scan ---")
+    from sr_threshold_selection._padding import _calculate_resulting_length
+    from src.core.constants import MAX_PAD_SEC, PAD_INCREMENT_SEC, TRIM_DECIMAL_PLACES
+
+    cases = [
+        ([3.4, 46.3, 31.3, 48.0], [6.7, 53.4, 46.1, 54.8], 94.0),
+        ([30.6, 13.0, 36.3, 73.0], [44.4, 21.3, 47.6, 83.7], 87.4),
+        ([9.3, 42.6, 35.8], [22.6, 54.5, 50.1], 89.6),
+    ]
+    for starts, ends, target in cases:
+        expected = 0.0
+        for step in range(int(MAX_PAD_SEC / PAD_INCREMENT_SEC + TRIM_TIMESTAMP_EPSILON_SEC) + 1):
+            current_pad = round(min(MAX_PAD_SEC, step * PAD_INCREMENT_SEC), TRIM_DECIMAL_PLACES)
+            if _calculate_resulting_length(starts, ends, 100.0, current_pad) < target - TRIM_TIMESTAMP_EPSILON_SEC:
+                expected = current_pad
+                continue
+            break
+
+        assert find_optimal_padding(starts, ends, 100.0, target) == expected
+    print("  ✓ Unsorted silences match grid scan")
+
+
+def test_resulting_length_matches_keep_segment_sum():
+    """Test that the allocation-free length matches summing the keep-segments."""
+    print("\n--- Test: Resulting length matches keep-segment sum ---")
+    from sr_threshold_selection._padding import (
+        _calculate_resulting_length,
+        _normalize_timestamp,
+        _build_keep_segments,
+    )
+
+    starts = [0.0, 5.0, 20.0, 31.5, 48.0, 70.25, 79.5]
+    ends = [1.2, 9.0, 26.0, 33.0, 60.0, 71.0]
+    duration = 80.0
+
+    for pad in (0.0, 0.1, 0.25, 0.6, 1.0, 2.5, 6.0):
+        segments = _build_keep_segments(starts, ends, duration, pad)
+        expected = _normalize_timestamp(sum(end - start for start, end in segments))
+        assert _calculate_resulting_length(starts, ends, duration, pad) == expected
+    print("  ✓ Resulting length matches keep-segment sum")
+
+
 def test_threshold_ordering():
     """Test that threshold selection respects ordering (quiet first)."""
     print("\n--- Test: Threshold ordering ---")
@@ -252,6 +319,9 @@ def test_black_box_api():
         test_find_optimal_padding_no_silence,
         test_find_optimal_padding_target_exceeds_duration,
         test_find_optimal_padding_already_at_target,
+        test_find_optimal_padding_matches_linear_grid_scan,
+        test_find_optimal_padding_unsorted_input_uses_grid_scan,
+        test_resulting_length_matches_keep_segment_sum,
         test_threshold_ordering,
         test_empty_candidates_raises,
         test_epsilon_tolerance,
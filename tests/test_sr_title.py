@@ -345,6 +345,19 @@ class TestGenerateTitleWithOpenRouter:
             assert result == "العنوان الأول"
             assert mock_request.call_count == 2
     
+    def test_single_candidate_skips_scoring_call(self):
+        """Test that a lone candidate is returned without a scoring request."""
+        with patch("sr_title.api.openrouter_request") as mock_request:
+            mock_request.side_effect = ['["Only Title"]']
+            
+            result = generate_title_with_openrouter(
+                api_key="test-key",
+                transcript="Only Title and more",
+            )
+            
+            assert result == "Only Title"
+            assert mock_request.call_count == 1
+    
     def test_empty_transcript_raises(self):
         """Test that empty transcript raises before API calls."""
         with pytest.raises(RuntimeError, match="empty"):
@@ -388,7 +401,7 @@ class TestGenerateTitleWithOpenRouter:
     def test_correct_model_passed(self):
         """Test that correct model is passed to API calls."""
         with patch("sr_title.api.openrouter_request") as mock_request:
-            mock_request.side_effect = ['["Title"]', '{"evaluations": [{"verbatim_score": 10, "correctness_score": 10}]}']
+            mock_request.side_effect = ['["Title", "Other Title"]', '{"evaluations": [{"verbatim_score": 10, "correctness_score": 10}, {"verbatim_score": 5, "correctness_score": 5}]}']
             
             generate_title_with_openrouter(
                 api_key="test-key",
@@ -403,7 +416,7 @@ class TestGenerateTitleWithOpenRouter:
     def test_default_model_used(self):
         """Test that default model is used when not specified."""
         with patch("sr_title.api.openrouter_request") as mock_request:
-            mock_request.side_effect = ['["Title"]', '{"evaluations": [{"verbatim_score": 10, "correctness_score": 10}]}']
+            mock_request.side_effect = ['["Title", "Other Title"]', '{"evaluations": [{"verbatim_score": 10, "correctness_score": 10}, {"verbatim_score": 5, "correctness_score": 5}]}']
             
             generate_title_with_openrouter(
                 api_key="test-key",
@@ -416,7 +429,7 @@ class TestGenerateTitleWithOpenRouter:
     def test_prompts_contain_transcript(self):
         """Test that prompts include the transcript."""
         with patch("sr_title.api.openrouter_request") as mock_request:
-            mock_request.side_effect = ['["Title"]', '{"evaluations": [{"verbatim_score": 10, "correctness_score": 10}]}']
+            mock_request.side_effect = ['["Title", "Other Title"]', '{"evaluations": [{"verbatim_score": 10, "correctness_score": 10}, {"verbatim_score": 5, "correctness_score": 5}]}']
             
             test_transcript = "Test transcript content here"
             generate_title_with_openrouter(
@@ -23,6 +23,7 @@ from src.core.constants import (
     TARGET_SEARCH_HIGH_DB,
     TARGET_SEARCH_LOW_DB,
     TARGET_SEARCH_MIN_SILENCE_LEN_SEC,
+    TRIM_TIMESTAMP_EPSILON_SEC,
 )
 
 
@@ -232,3 +233,53 @@ class TestBlackBoxApi:
         assert isinstance(plan, TrimPlan)
         assert plan.input_duration_sec > 0
         assert len(plan.segments_to_keep) > 0
+
+
+class TestTargetPaddingSearch:
+    """Test target-mode padding search without FFmpeg."""
+
+    STARTS = [0.0, 5.0, 20.0, 31.5, 48.0, 70.25]
+    ENDS = [1.2, 9.0, 26.0, 33.0, 60.0, 71.0]
+    DURATION = 80.0
+
+    def test_resulting_length_matches_keep_segment_sum(self):
+        """Test that the length-only probe matches summing the built segments."""
+        from src.media.silence_detector import (
+            build_keep_segments_from_silences,
+            calculate_resulting_length,
+            normalize_timestamp,
+        )
+
+        for pad in (0.0, 0.1, 0.25, 0.6, 1.0, 2.5, 6.0):
+            segments = build_keep_segments_from_silences(self.STARTS, self.ENDS, self.DURATION, pad)
+            expected = normalize_timestamp(sum(end - start for start, end in segments))
+            assert calculate_resulting_length(self.STARTS, self.ENDS, self.DURATION, pad) == expected
+
+    def test_target_plan_builds_segments_once(self, monkeypatch, tmp_path):
+        """Test that padding probes use lengths and only the chosen pad builds segments."""
+        from sr_trim_plan import api
+
+        monkeypatch.setattr(api, "detect_edge_only_cached", lambda **_kwargs: ([], []))
+        monkeypatch.setattr(
+            api,
+            "detect_primary_with_cached_edges",
+            lambda **_kwargs: (list(self.STARTS), list(self.ENDS)),
+        )
+        built_pads: list[float] = []
+        build_segments = api.build_keep_segments_from_silences
+
+        def _counting_build(**kwargs):
+            built_pads.append(kwargs["pad_sec"])
+            return build_segments(**kwargs)
+
+        monkeypatch.setattr(api, "build_keep_segments_from_silences", _counting_build)
+
+        plan = api._build_target_trim_plan(
+            input_file=tmp_path / "clip.mp4",
+            temp_dir=None,
+            duration_sec=self.DURATION,
+            target_length=70.0,
+        )
+
+        assert built_pads == [plan.resolved_pad_sec]
+        assert plan.resulting_length_sec <= 70.0 + TRIM_TIMESTAMP_EPSILON_SEC